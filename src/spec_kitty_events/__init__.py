@@ -302,6 +302,7 @@ from spec_kitty_events.mission_next import (
     DecisionInputAnsweredPayload,
     MissionRunCompletedPayload,
     MissionNextAnomaly,
+    MissionNextAnomalyCode,
     ReducedMissionRunState,
     reduce_mission_next_events,
 )
@@ -721,6 +722,7 @@ __all__ = [
     "DecisionInputAnsweredPayload",
     "MissionRunCompletedPayload",
     "MissionNextAnomaly",
+    "MissionNextAnomalyCode",
     "ReducedMissionRunState",
     "reduce_mission_next_events",
     # Dossier event contracts
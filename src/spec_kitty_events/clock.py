@@ -75,7 +75,10 @@ class LamportClock:
             >>> clock.current()
             6
         """
-        self._counter = max(self._counter, remote_clock) + 1
+        # Conditional expression rather than max(): avoids a builtin call on
+        # the per-event receive path.
+        counter = self._counter
+        self._counter = (counter if counter >= remote_clock else remote_clock) + 1
         self._storage.save(self.node_id, self._counter)
 
     def current(self) -> int:
@@ -8,7 +8,7 @@ multi-participant mission coordination.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Dict, FrozenSet, List, Literal, Optional, Sequence, Set, Tuple
+from typing import Dict, FrozenSet, List, Literal, Mapping, Optional, Sequence, Set, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -549,6 +549,15 @@ class ReducedCollaborationState(BaseModel):
         None, description="Last event_id in processed sequence"
     )
 
+    @property
+    def anomaly_count(self) -> int:
+        """Number of recorded anomalies.
+
+        A plain ``@property`` rather than a field so that ``model_dump()`` and
+        the committed golden outputs are unchanged.
+        """
+        return len(self.anomalies)
+
 
 # ── Section 5: Collaboration Reducer ──────────────────────────────────────
 
@@ -562,7 +571,7 @@ def reduce_collaboration_events(
     events: Sequence[Event],
     *,
     mode: Literal["strict", "permissive"] = "strict",
-    roster: Optional[Dict[str, ParticipantIdentity]] = None,
+    roster: Optional[Mapping[str, ParticipantIdentity]] = None,
 ) -> ReducedCollaborationState:
     """Fold collaboration events into projected collaboration state.
 
@@ -580,9 +589,9 @@ def reduce_collaboration_events(
         events: Sequence of Event instances (may include non-collaboration types).
         mode: ``"strict"`` raises UnknownParticipantError for non-rostered
             participants. ``"permissive"`` records anomalies instead.
-        roster: Optional seeded participant roster. When provided, participants
-            are pre-populated and events can reference them without a prior
-            ParticipantJoined event.
+        roster: Optional seeded participant roster (any read-only mapping).
+            When provided, participants are pre-populated and events can
+            reference them without a prior ParticipantJoined event.
 
     Returns:
         A frozen ReducedCollaborationState reflecting the processed events.
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -35,6 +36,17 @@ _SPECIAL_FIXTURE_TYPES: frozenset[str] = frozenset({
 })
 
 
+@lru_cache(maxsize=1)
+def _manifest_index() -> Dict[str, Dict[str, Any]]:
+    """Parse the bundled manifest once and index its entries by ``id``.
+
+    Entries keep manifest order. The returned mapping is shared; callers
+    must treat it as read-only.
+    """
+    manifest: Dict[str, Any] = json.loads(_MANIFEST_PATH.read_bytes())
+    return {entry["id"]: entry for entry in manifest["fixtures"]}
+
+
 @dataclass(frozen=True)
 class FixtureCase:
     """A single fixture test case loaded from the manifest."""
@@ -69,13 +81,9 @@ def load_fixtures(category: str) -> List[FixtureCase]:
             f"Valid categories: {sorted(_VALID_CATEGORIES)}"
         )
 
-    with open(_MANIFEST_PATH, "r", encoding="utf-8") as fh:
-        manifest: Dict[str, Any] = json.load(fh)
-
     fixtures: List[FixtureCase] = []
 
-    entries: List[Dict[str, Any]] = manifest["fixtures"]
-    for entry in entries:
+    for entry in _manifest_index().values():
         fixture_path: str = entry["path"]
         # Filter by category prefix in path
         if not fixture_path.startswith(category + "/"):
@@ -136,15 +144,7 @@ def load_replay_stream(fixture_id: str) -> List[Dict[str, Any]]:
         ValueError: If *fixture_id* is not found or is not a replay_stream entry.
         FileNotFoundError: If the JSONL file does not exist on disk.
     """
-    with open(_MANIFEST_PATH, "r", encoding="utf-8") as fh:
-        manifest: Dict[str, Any] = json.load(fh)
-
-    entry: Dict[str, Any] | None = None
-    for candidate in manifest["fixtures"]:
-        if candidate["id"] == fixture_id:
-            entry = candidate
-            break
-
+    entry = _manifest_index().get(fixture_id)
     if entry is None:
         raise ValueError(
             f"Replay stream fixture not found in manifest: {fixture_id!r}"
@@ -163,13 +163,12 @@ def load_replay_stream(fixture_id: str) -> List[Dict[str, Any]]:
             f"Replay stream file referenced in manifest does not exist: {full_path}"
         )
 
-    events: List[Dict[str, Any]] = []
-    with open(full_path, "r", encoding="utf-8") as fh:
-        for line_number, line in enumerate(fh, start=1):
-            stripped = line.strip()
-            if not stripped:
-                continue
-            event_dict: Dict[str, Any] = json.loads(stripped)
-            events.append(event_dict)
+    # Read the stream in one call and parse each line straight from bytes
+    # (json.loads detects UTF-8), avoiding a per-line decode + readline loop.
+    events: List[Dict[str, Any]] = [
+        json.loads(line)
+        for line in full_path.read_bytes().splitlines()
+        if line.strip()
+    ]
 
     return events
@@ -11,6 +11,7 @@ strict=True is specified.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Callable, Dict, Tuple, Type, Union
 
 from pydantic import BaseModel, ValidationError as PydanticValidationError
@@ -476,6 +477,21 @@ def _validate_with_model(
         return tuple(violations)
 
 
+@lru_cache(maxsize=None)
+def _schema_validator(schema_name: str) -> Any:
+    """Return a compiled Draft 2020-12 validator for a committed schema.
+
+    Loading the schema file and compiling the validator dominates the cost of
+    a single-payload check, so each schema is compiled once per process.
+    Callers must have already verified that jsonschema is importable.
+    """
+    import jsonschema  # type: ignore[import-untyped]
+
+    from spec_kitty_events.schemas import load_schema
+
+    return jsonschema.Draft202012Validator(load_schema(schema_name))
+
+
 def _validate_with_schema(
     payload: Dict[str, Any],
     schema_name: str,
@@ -499,8 +515,7 @@ def _validate_with_schema(
         ImportError: If strict=True and jsonschema is unavailable.
     """
     try:
-        import jsonschema  # type: ignore[import-untyped]
-        from jsonschema import Draft202012Validator
+        import jsonschema  # noqa: F401
     except ImportError:
         if strict:
             raise ImportError(
@@ -510,13 +525,8 @@ def _validate_with_schema(
         # Graceful degradation
         return ((), True)
 
-    # Load schema from package
-    from spec_kitty_events.schemas import load_schema
-
-    schema = load_schema(schema_name)
-
-    # Validate with jsonschema
-    validator = Draft202012Validator(schema)
+    # Validate with the cached, compiled schema validator
+    validator = _schema_validator(schema_name)
     errors = sorted(validator.iter_errors(payload), key=lambda e: e.json_path)
 
     if not errors:
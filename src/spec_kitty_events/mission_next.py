@@ -77,6 +77,19 @@ TERMINAL_RUN_STATUSES: FrozenSet[MissionRunStatus] = frozenset({
     MissionRunStatus.COMPLETED,
 })
 
+
+class MissionNextAnomalyCode(str, Enum):
+    """Machine-readable classification of mission-next reducer anomalies."""
+
+    DUPLICATE_START = "duplicate_start"
+    DUPLICATE_COMPLETION = "duplicate_completion"
+    EVENT_AFTER_TERMINAL = "event_after_terminal"
+    EVENT_BEFORE_START = "event_before_start"
+    DUPLICATE_DECISION = "duplicate_decision"
+    RUN_ID_MISMATCH = "run_id_mismatch"
+    INVALID_PAYLOAD = "invalid_payload"
+
+
 # ── Section 4: Payload Models ────────────────────────────────────────────────
 
 
@@ -195,6 +208,9 @@ class MissionNextAnomaly(BaseModel):
     event_id: str = Field(..., description="ID of the event that caused the anomaly")
     event_type: str = Field(..., description="Type of the problematic event")
     reason: str = Field(..., description="Human-readable explanation")
+    code: Optional[MissionNextAnomalyCode] = Field(
+        default=None, description="Machine-readable anomaly classification"
+    )
 
 
 class ReducedMissionRunState(BaseModel):
@@ -298,12 +314,14 @@ def reduce_mission_next_events(
                     event_id=event.event_id,
                     event_type=event.event_type,
                     reason="Duplicate completion (terminal idempotency)",
+                    code=MissionNextAnomalyCode.DUPLICATE_COMPLETION,
                 ))
             else:
                 anomalies.append(MissionNextAnomaly(
                     event_id=event.event_id,
                     event_type=event.event_type,
                     reason=f"Event after terminal state ({run_status})",
+                    code=MissionNextAnomalyCode.EVENT_AFTER_TERMINAL,
                 ))
             continue
 
@@ -314,6 +332,7 @@ def reduce_mission_next_events(
                     event_id=event.event_id,
                     event_type=event.event_type,
                     reason="Duplicate MissionRunStarted (first one wins)",
+                    code=MissionNextAnomalyCode.DUPLICATE_START,
                 ))
                 continue
             try:
@@ -323,6 +342,7 @@ def reduce_mission_next_events(
                     event_id=event.event_id,
                     event_type=event.event_type,
                     reason="Invalid MissionRunStarted payload",
+                    code=MissionNextAnomalyCode.INVALID_PAYLOAD,
                 ))
                 continue
             run_id = payload_started.run_id
@@ -336,6 +356,7 @@ def reduce_mission_next_events(
                 event_id=event.event_id,
                 event_type=event.event_type,
                 reason="Event before MissionRunStarted",
+                code=MissionNextAnomalyCode.EVENT_BEFORE_START,
             ))
             continue
 
@@ -347,6 +368,7 @@ def reduce_mission_next_events(
                     event_id=event.event_id,
                     event_type=event.event_type,
                     reason="Invalid NextStepIssued payload",
+                    code=MissionNextAnomalyCode.INVALID_PAYLOAD,
                 ))
                 continue
             if payload_issued.run_id != run_id:
@@ -354,6 +376,7 @@ def reduce_mission_next_events(
                     event_id=event.event_id,
                     event_type=event.event_type,
                     reason=f"run_id mismatch: expected '{run_id}', got '{payload_issued.run_id}'",
+                    code=MissionNextAnomalyCode.RUN_ID_MISMATCH,
                 ))
                 continue
             current_step_id = payload_issued.step_id
@@ -366,6 +389,7 @@ def reduce_mission_next_events(
                     event_id=event.event_id,
                     event_type=event.event_type,
                     reason="Invalid NextStepAutoCompleted payload",
+                    code=MissionNextAnomalyCode.INVALID_PAYLOAD,
                 ))
                 continue
             if payload_completed.run_id != run_id:
@@ -373,6 +397,7 @@ def reduce_mission_next_events(
                     event_id=event.event_id,
                     event_type=event.event_type,
                     reason=f"run_id mismatch: expected '{run_id}', got '{payload_completed.run_id}'",
+                    code=MissionNextAnomalyCode.RUN_ID_MISMATCH,
                 ))
                 continue
             if payload_completed.step_id not in completed_steps:
@@ -388,6 +413,7 @@ def reduce_mission_next_events(
                     event_id=event.event_id,
                     event_type=event.event_type,
                     reason="Invalid DecisionInputRequested payload",
+                    code=MissionNextAnomalyCode.INVALID_PAYLOAD,
                 ))
                 continue
             if payload_req.run_id != run_id:
@@ -395,6 +421,7 @@ def reduce_mission_next_events(
                     event_id=event.event_id,
                     event_type=event.event_type,
                     reason=f"run_id mismatch: expected '{run_id}', got '{payload_req.run_id}'",
+                    code=MissionNextAnomalyCode.RUN_ID_MISMATCH,
                 ))
                 continue
             if payload_req.decision_id in pending_decisions:
@@ -403,6 +430,7 @@ def reduce_mission_next_events(
                     event_id=event.event_id,
                     event_type=event.event_type,
                     reason=f"Duplicate decision request '{payload_req.decision_id}'",
+                    code=MissionNextAnomalyCode.DUPLICATE_DECISION,
                 ))
             else:
                 pending_decisions[payload_req.decision_id] = payload_req
@@ -415,6 +443,7 @@ def reduce_mission_next_events(
                     event_id=event.event_id,
                     event_type=event.event_type,
                     reason="Invalid DecisionInputAnswered payload",
+                    code=MissionNextAnomalyCode.INVALID_PAYLOAD,
                 ))
                 continue
             if payload_ans.run_id != run_id:
@@ -422,6 +451,7 @@ def reduce_mission_next_events(
                     event_id=event.event_id,
                     event_type=event.event_type,
                     reason=f"run_id mismatch: expected '{run_id}', got '{payload_ans.run_id}'",
+                    code=MissionNextAnomalyCode.RUN_ID_MISMATCH,
                 ))
                 continue
             answered_decisions[payload_ans.decision_id] = payload_ans
@@ -436,6 +466,7 @@ def reduce_mission_next_events(
                     event_id=event.event_id,
                     event_type=event.event_type,
                     reason="Invalid MissionRunCompleted payload",
+                    code=MissionNextAnomalyCode.INVALID_PAYLOAD,
                 ))
                 continue
             if payload_done.run_id != run_id:
@@ -443,6 +474,7 @@ def reduce_mission_next_events(
                     event_id=event.event_id,
                     event_type=event.event_type,
                     reason=f"run_id mismatch: expected '{run_id}', got '{payload_done.run_id}'",
+                    code=MissionNextAnomalyCode.RUN_ID_MISMATCH,
                 ))
                 continue
             run_status = MissionRunStatus.COMPLETED
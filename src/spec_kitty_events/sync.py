@@ -60,6 +60,15 @@ _EVENT_TO_OUTCOME: Dict[str, SyncOutcome] = {
     SYNC_REPLAY_COMPLETED: SyncOutcome.REPLAY_COMPLETED,
 }
 
+# Map outcomes to their ReducedSyncState.outcome_counts key
+_OUTCOME_TO_COUNT_KEY: Dict[SyncOutcome, str] = {
+    SyncOutcome.ACCEPTED: "accepted_count",
+    SyncOutcome.REJECTED: "rejected_count",
+    SyncOutcome.RETRY_SCHEDULED: "retry_count",
+    SyncOutcome.DEAD_LETTERED: "dead_letter_count",
+    SyncOutcome.REPLAY_COMPLETED: "replay_count",
+}
+
 # ── Section 4: Anomaly Model ─────────────────────────────────────────────────
 
 
@@ -248,24 +257,12 @@ def reduce_sync_events(
     # Step 5: Mutable accumulator for fold
     anomalies: List[SyncAnomaly] = []
     connector_id: Optional[str] = None
-    outcome_counts: Dict[str, int] = {
-        "accepted_count": 0,
-        "rejected_count": 0,
-        "retry_count": 0,
-        "dead_letter_count": 0,
-        "replay_count": 0,
-    }
+    outcome_counts: Dict[str, int] = dict.fromkeys(
+        _OUTCOME_TO_COUNT_KEY.values(), 0
+    )
     outcome_log: List[Tuple[str, str, str]] = []
     seen_delivery_pairs: Set[Tuple[str, str]] = set()
 
-    _OUTCOME_TO_COUNT_KEY: Dict[SyncOutcome, str] = {
-        SyncOutcome.ACCEPTED: "accepted_count",
-        SyncOutcome.REJECTED: "rejected_count",
-        SyncOutcome.RETRY_SCHEDULED: "retry_count",
-        SyncOutcome.DEAD_LETTERED: "dead_letter_count",
-        SyncOutcome.REPLAY_COMPLETED: "replay_count",
-    }
-
     for event in sync_events:
         event_type = event.event_type
         event_id = event.event_id
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import itertools
 import uuid
+from collections.abc import Callable, Mapping
 from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
 
 import pytest
-from hypothesis import given, settings
-from hypothesis import strategies as st
 
 from spec_kitty_events import (
     Event,
@@ -23,49 +25,66 @@ from spec_kitty_events.mission_next import (
     NEXT_STEP_AUTO_COMPLETED,
     NEXT_STEP_ISSUED,
     NEXT_STEP_PLANNED,
+    MissionNextAnomalyCode,
     MissionRunStatus,
 )
 
 UTC = timezone.utc
 _PROJECT_UUID = uuid.UUID("12345678-1234-5678-1234-567812345678")
 
-_clock_counter = 0
+# Per-lamport-clock memo of the derived identifiers/timestamps. Tests reuse
+# the same small set of clock values, so these are formatted once per value.
+_TS_BY_LC: dict[int, str] = {}
+_EVENT_ID_BY_LC: dict[int, str] = {}
+_CORR_ID_BY_LC: dict[int, str] = {}
 
 
+@lru_cache(maxsize=None)
 def _make_actor_dict(
     actor_id: str = "agent-claude",
     actor_type: str = "llm",
-) -> dict:  # type: ignore[type-arg]
-    return {
+) -> Mapping[str, str]:
+    """Return a shared, read-only actor mapping per (actor_id, actor_type)."""
+    return MappingProxyType({
         "actor_id": actor_id,
         "actor_type": actor_type,
         "display_name": "Claude",
         "provider": "anthropic",
         "model": "claude-opus-4-6",
-    }
+    })
 
 
 def make_event(
     event_type: str,
     payload: dict,  # type: ignore[type-arg]
     event_id: str | None = None,
-    lamport_clock: int | None = None,
+    *,
+    lamport_clock: int,
     aggregate_id: str = "run/run-001",
 ) -> Event:
-    """Factory for creating test Event instances."""
-    global _clock_counter
-    if lamport_clock is None:
-        _clock_counter += 1
-        lamport_clock = _clock_counter
+    """Factory for creating test Event instances.
+
+    ``lamport_clock`` is explicit (no module-level counter) so tests stay
+    independent of execution order and can be distributed across workers.
+    """
+    timestamp = _TS_BY_LC.get(lamport_clock)
+    if timestamp is None:
+        timestamp = _TS_BY_LC[lamport_clock] = datetime(
+            2024, 1, 1, 0, 0, lamport_clock % 60, tzinfo=UTC
+        ).isoformat()
     if event_id is None:
-        event_id = f"01HX{lamport_clock:022d}"
-    corr_id = f"01CX{lamport_clock:022d}"
+        event_id = _EVENT_ID_BY_LC.get(lamport_clock)
+        if event_id is None:
+            event_id = _EVENT_ID_BY_LC[lamport_clock] = f"01HX{lamport_clock:022d}"
+    corr_id = _CORR_ID_BY_LC.get(lamport_clock)
+    if corr_id is None:
+        corr_id = _CORR_ID_BY_LC[lamport_clock] = f"01CX{lamport_clock:022d}"
     return Event(
         event_id=event_id,
         event_type=event_type,
         aggregate_id=aggregate_id,
         payload=payload,
-        timestamp=datetime(2024, 1, 1, 0, 0, lamport_clock % 60, tzinfo=UTC).isoformat(),
+        timestamp=timestamp,
         build_id="build-test",
         node_id="test-node",
         lamport_clock=lamport_clock,
@@ -75,6 +94,39 @@ def make_event(
     )
 
 
+def assert_anomaly_only(
+    state: ReducedMissionRunState,
+    *,
+    code: MissionNextAnomalyCode,
+    status: MissionRunStatus | None = MissionRunStatus.RUNNING,
+) -> None:
+    """Assert the run ended in ``status`` with exactly one ``code`` anomaly."""
+    assert state.run_status == status
+    assert len(state.anomalies) == 1
+    assert state.anomalies[0].code is code
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _warmup_reducer() -> None:
+    """Run the mission-next reducer once before the first test in this module.
+
+    Sorting, dedup and payload validation pay their lazy-import cost here
+    instead of in whichever test happens to run first.
+    """
+    reduce_mission_next_events([
+        make_event(
+            MISSION_RUN_STARTED,
+            {
+                "run_id": "warmup",
+                "mission_type": "warmup",
+                "actor": {"actor_id": "warmup", "actor_type": "service"},
+            },
+            lamport_clock=0,
+            aggregate_id="run/warmup",
+        )
+    ])
+
+
 # ── Empty Input ──────────────────────────────────────────────────────────────
 
 
@@ -168,8 +220,7 @@ class TestDuplicateStart:
         state = reduce_mission_next_events(events)
         assert state.run_id == "run-1"
         assert state.mission_type == "software-dev"
-        assert len(state.anomalies) == 1
-        assert "Duplicate" in state.anomalies[0].reason
+        assert_anomaly_only(state, code=MissionNextAnomalyCode.DUPLICATE_START)
 
 
 # ── Event After Terminal ─────────────────────────────────────────────────────
@@ -192,9 +243,11 @@ class TestEventAfterTerminal:
             }, lamport_clock=3),
         ]
         state = reduce_mission_next_events(events)
-        assert state.run_status == MissionRunStatus.COMPLETED
-        assert len(state.anomalies) == 1
-        assert "terminal" in state.anomalies[0].reason.lower()
+        assert_anomaly_only(
+            state,
+            code=MissionNextAnomalyCode.EVENT_AFTER_TERMINAL,
+            status=MissionRunStatus.COMPLETED,
+        )
 
 
 # ── Event Before Start ───────────────────────────────────────────────────────
@@ -215,8 +268,7 @@ class TestEventBeforeStart:
         ]
         state = reduce_mission_next_events(events)
         assert state.run_id == "run-1"
-        assert len(state.anomalies) == 1
-        assert "before" in state.anomalies[0].reason.lower()
+        assert_anomaly_only(state, code=MissionNextAnomalyCode.EVENT_BEFORE_START)
 
 
 # ── Duplicate Decision Request ───────────────────────────────────────────────
@@ -241,8 +293,7 @@ class TestDuplicateDecisionRequest:
             }, lamport_clock=3),
         ]
         state = reduce_mission_next_events(events)
-        assert len(state.anomalies) == 1
-        assert "Duplicate decision" in state.anomalies[0].reason
+        assert_anomaly_only(state, code=MissionNextAnomalyCode.DUPLICATE_DECISION)
 
 
 # ── Decision Lifecycle ───────────────────────────────────────────────────────
@@ -296,9 +347,11 @@ class TestTerminalIdempotency:
             }, lamport_clock=3),
         ]
         state = reduce_mission_next_events(events)
-        assert state.run_status == MissionRunStatus.COMPLETED
-        assert len(state.anomalies) == 1
-        assert "idempotency" in state.anomalies[0].reason.lower()
+        assert_anomaly_only(
+            state,
+            code=MissionNextAnomalyCode.DUPLICATE_COMPLETION,
+            status=MissionRunStatus.COMPLETED,
+        )
 
 
 # ── Step Tracking ────────────────────────────────────────────────────────────
@@ -437,92 +490,83 @@ class TestNextStepPlannedIgnored:
 # ── P1: Run-ID Consistency Guard ─────────────────────────────────────────────
 
 
-class TestRunIdConsistency:
-    """P1 fix: events with mismatched run_id should be anomalied and skipped."""
-
-    def test_step_issued_wrong_run_id(self) -> None:
-        actor = _make_actor_dict()
-        events = [
-            make_event(MISSION_RUN_STARTED, {
-                "run_id": "run-1", "mission_type": "software-dev", "actor": actor,
-            }, lamport_clock=1),
-            make_event(NEXT_STEP_ISSUED, {
-                "run_id": "run-OTHER", "step_id": "S1", "agent_id": "a1", "actor": actor,
-            }, lamport_clock=2),
-        ]
-        state = reduce_mission_next_events(events)
-        assert state.current_step_id is None  # not applied
-        assert len(state.anomalies) == 1
-        assert "run_id mismatch" in state.anomalies[0].reason
-
-    def test_step_completed_wrong_run_id(self) -> None:
-        actor = _make_actor_dict()
-        events = [
-            make_event(MISSION_RUN_STARTED, {
-                "run_id": "run-1", "mission_type": "software-dev", "actor": actor,
-            }, lamport_clock=1),
-            make_event(NEXT_STEP_ISSUED, {
-                "run_id": "run-1", "step_id": "S1", "agent_id": "a1", "actor": actor,
-            }, lamport_clock=2),
-            make_event(NEXT_STEP_AUTO_COMPLETED, {
-                "run_id": "run-OTHER", "step_id": "S1", "agent_id": "a1",
-                "result": "success", "actor": actor,
-            }, lamport_clock=3),
-        ]
-        state = reduce_mission_next_events(events)
-        assert state.current_step_id == "S1"  # not cleared
-        assert state.completed_steps == ()  # not added
-        assert len(state.anomalies) == 1
+_RUN_ID_MISMATCH_CASES = [
+    pytest.param(
+        [],
+        (NEXT_STEP_ISSUED, {
+            "run_id": "run-OTHER", "step_id": "S1", "agent_id": "a1",
+        }),
+        lambda s: s.current_step_id is None,  # not applied
+        id="step_issued",
+    ),
+    pytest.param(
+        [(NEXT_STEP_ISSUED, {
+            "run_id": "run-1", "step_id": "S1", "agent_id": "a1",
+        })],
+        (NEXT_STEP_AUTO_COMPLETED, {
+            "run_id": "run-OTHER", "step_id": "S1", "agent_id": "a1",
+            "result": "success",
+        }),
+        # not cleared, not added
+        lambda s: s.current_step_id == "S1" and s.completed_steps == (),
+        id="step_completed",
+    ),
+    pytest.param(
+        [],
+        (DECISION_INPUT_REQUESTED, {
+            "run_id": "run-OTHER", "decision_id": "d1", "step_id": "S1",
+            "question": "Q?",
+        }),
+        lambda s: s.pending_decisions == {},
+        id="decision_requested",
+    ),
+    pytest.param(
+        [(DECISION_INPUT_REQUESTED, {
+            "run_id": "run-1", "decision_id": "d1", "step_id": "S1",
+            "question": "Q?",
+        })],
+        (DECISION_INPUT_ANSWERED, {
+            "run_id": "run-OTHER", "decision_id": "d1", "answer": "yes",
+        }),
+        # not cleared
+        lambda s: "d1" in s.pending_decisions and s.answered_decisions == {},
+        id="decision_answered",
+    ),
+    pytest.param(
+        [],
+        (MISSION_RUN_COMPLETED, {
+            "run_id": "run-OTHER", "mission_type": "software-dev",
+        }),
+        lambda s: s.run_status == MissionRunStatus.RUNNING,  # not terminated
+        id="completion",
+    ),
+]
 
-    def test_decision_requested_wrong_run_id(self) -> None:
-        actor = _make_actor_dict()
-        events = [
-            make_event(MISSION_RUN_STARTED, {
-                "run_id": "run-1", "mission_type": "software-dev", "actor": actor,
-            }, lamport_clock=1),
-            make_event(DECISION_INPUT_REQUESTED, {
-                "run_id": "run-OTHER", "decision_id": "d1", "step_id": "S1",
-                "question": "Q?", "actor": actor,
-            }, lamport_clock=2),
-        ]
-        state = reduce_mission_next_events(events)
-        assert state.pending_decisions == {}
-        assert len(state.anomalies) == 1
 
-    def test_decision_answered_wrong_run_id(self) -> None:
-        actor = _make_actor_dict()
-        events = [
-            make_event(MISSION_RUN_STARTED, {
-                "run_id": "run-1", "mission_type": "software-dev", "actor": actor,
-            }, lamport_clock=1),
-            make_event(DECISION_INPUT_REQUESTED, {
-                "run_id": "run-1", "decision_id": "d1", "step_id": "S1",
-                "question": "Q?", "actor": actor,
-            }, lamport_clock=2),
-            make_event(DECISION_INPUT_ANSWERED, {
-                "run_id": "run-OTHER", "decision_id": "d1", "answer": "yes",
-                "actor": _make_actor_dict("user-1", "human"),
-            }, lamport_clock=3),
-        ]
-        state = reduce_mission_next_events(events)
-        assert "d1" in state.pending_decisions  # not cleared
-        assert state.answered_decisions == {}
-        assert len(state.anomalies) == 1
+class TestRunIdConsistency:
+    """P1 fix: events with mismatched run_id should be anomalied and skipped."""
 
-    def test_completion_wrong_run_id(self) -> None:
+    _STARTED = make_event(MISSION_RUN_STARTED, {
+        "run_id": "run-1", "mission_type": "software-dev",
+        "actor": _make_actor_dict(),
+    }, lamport_clock=1)
+
+    @pytest.mark.parametrize("prefix, wrong, check", _RUN_ID_MISMATCH_CASES)
+    def test_wrong_run_id(
+        self,
+        prefix: list[tuple[str, dict]],  # type: ignore[type-arg]
+        wrong: tuple[str, dict],  # type: ignore[type-arg]
+        check: Callable[[ReducedMissionRunState], bool],
+    ) -> None:
         actor = _make_actor_dict()
-        events = [
-            make_event(MISSION_RUN_STARTED, {
-                "run_id": "run-1", "mission_type": "software-dev", "actor": actor,
-            }, lamport_clock=1),
-            make_event(MISSION_RUN_COMPLETED, {
-                "run_id": "run-OTHER", "mission_type": "software-dev", "actor": actor,
-            }, lamport_clock=2),
-        ]
+        events = [self._STARTED]
+        for clock, (event_type, payload) in enumerate([*prefix, wrong], start=2):
+            events.append(
+                make_event(event_type, {**payload, "actor": actor}, lamport_clock=clock)
+            )
         state = reduce_mission_next_events(events)
-        assert state.run_status == MissionRunStatus.RUNNING  # not terminated
-        assert len(state.anomalies) == 1
-        assert "run_id mismatch" in state.anomalies[0].reason
+        assert check(state)
+        assert_anomaly_only(state, code=MissionNextAnomalyCode.RUN_ID_MISMATCH)
 
 
 # ── P1: Malformed Payload Resilience ─────────────────────────────────────────
@@ -539,8 +583,10 @@ class TestMalformedPayloadResilience:
         ]
         state = reduce_mission_next_events(events)
         assert state.run_id is None
-        assert len(state.anomalies) == 1
-        assert "Invalid MissionRunStarted" in state.anomalies[0].reason
+        assert_anomaly_only(
+            state, code=MissionNextAnomalyCode.INVALID_PAYLOAD, status=None
+        )
+        assert state.anomalies[0].event_type == "MissionRunStarted"
 
     def test_malformed_step_issued_payload(self) -> None:
         actor = _make_actor_dict()
@@ -554,8 +600,8 @@ class TestMalformedPayloadResilience:
         ]
         state = reduce_mission_next_events(events)
         assert state.current_step_id is None
-        assert len(state.anomalies) == 1
-        assert "Invalid NextStepIssued" in state.anomalies[0].reason
+        assert_anomaly_only(state, code=MissionNextAnomalyCode.INVALID_PAYLOAD)
+        assert state.anomalies[0].event_type == "NextStepIssued"
 
     def test_malformed_step_completed_payload(self) -> None:
         actor = _make_actor_dict()
@@ -568,8 +614,8 @@ class TestMalformedPayloadResilience:
             }, lamport_clock=2),
         ]
         state = reduce_mission_next_events(events)
-        assert len(state.anomalies) == 1
-        assert "Invalid NextStepAutoCompleted" in state.anomalies[0].reason
+        assert_anomaly_only(state, code=MissionNextAnomalyCode.INVALID_PAYLOAD)
+        assert state.anomalies[0].event_type == "NextStepAutoCompleted"
 
     def test_malformed_decision_requested_payload(self) -> None:
         actor = _make_actor_dict()
@@ -580,8 +626,8 @@ class TestMalformedPayloadResilience:
             make_event(DECISION_INPUT_REQUESTED, {}, lamport_clock=2),
         ]
         state = reduce_mission_next_events(events)
-        assert len(state.anomalies) == 1
-        assert "Invalid DecisionInputRequested" in state.anomalies[0].reason
+        assert_anomaly_only(state, code=MissionNextAnomalyCode.INVALID_PAYLOAD)
+        assert state.anomalies[0].event_type == "DecisionInputRequested"
 
     def test_malformed_decision_answered_payload(self) -> None:
         actor = _make_actor_dict()
@@ -594,8 +640,8 @@ class TestMalformedPayloadResilience:
             }, lamport_clock=2),
         ]
         state = reduce_mission_next_events(events)
-        assert len(state.anomalies) == 1
-        assert "Invalid DecisionInputAnswered" in state.anomalies[0].reason
+        assert_anomaly_only(state, code=MissionNextAnomalyCode.INVALID_PAYLOAD)
+        assert state.anomalies[0].event_type == "DecisionInputAnswered"
 
     def test_malformed_completion_payload(self) -> None:
         actor = _make_actor_dict()
@@ -608,9 +654,8 @@ class TestMalformedPayloadResilience:
             }, lamport_clock=2),
         ]
         state = reduce_mission_next_events(events)
-        assert state.run_status == MissionRunStatus.RUNNING  # not terminated
-        assert len(state.anomalies) == 1
-        assert "Invalid MissionRunCompleted" in state.anomalies[0].reason
+        assert_anomaly_only(state, code=MissionNextAnomalyCode.INVALID_PAYLOAD)
+        assert state.anomalies[0].event_type == "MissionRunCompleted"
 
     def test_bad_event_does_not_stop_subsequent_processing(self) -> None:
         """After a malformed event, the reducer continues processing."""
@@ -636,38 +681,39 @@ class TestMalformedPayloadResilience:
 # ── Determinism ──────────────────────────────────────────────────────────────
 
 
-class TestDeterminism:
-    """Property test proving reducer determinism across physical orderings."""
+_DETERMINISM_EVENTS = (
+    make_event(MISSION_RUN_STARTED, {
+        "run_id": "run-1", "mission_type": "software-dev",
+        "actor": _make_actor_dict(),
+    }, lamport_clock=10),
+    make_event(NEXT_STEP_ISSUED, {
+        "run_id": "run-1", "step_id": "S1", "agent_id": "a1",
+        "actor": _make_actor_dict(),
+    }, lamport_clock=20),
+    make_event(NEXT_STEP_AUTO_COMPLETED, {
+        "run_id": "run-1", "step_id": "S1", "agent_id": "a1",
+        "result": "success", "actor": _make_actor_dict(),
+    }, lamport_clock=30),
+    make_event(MISSION_RUN_COMPLETED, {
+        "run_id": "run-1", "mission_type": "software-dev",
+        "actor": _make_actor_dict(),
+    }, lamport_clock=40),
+)
 
-    @given(st.randoms())
-    @settings(max_examples=200)
-    def test_deterministic_across_permutations(self, rng: object) -> None:
-        import random as _rng_mod
-        rng_inst = _rng_mod.Random()
 
-        actor = _make_actor_dict()
-        events = [
-            make_event(MISSION_RUN_STARTED, {
-                "run_id": "run-1", "mission_type": "software-dev", "actor": actor,
-            }, lamport_clock=10),
-            make_event(NEXT_STEP_ISSUED, {
-                "run_id": "run-1", "step_id": "S1", "agent_id": "a1", "actor": actor,
-            }, lamport_clock=20),
-            make_event(NEXT_STEP_AUTO_COMPLETED, {
-                "run_id": "run-1", "step_id": "S1", "agent_id": "a1",
-                "result": "success", "actor": actor,
-            }, lamport_clock=30),
-            make_event(MISSION_RUN_COMPLETED, {
-                "run_id": "run-1", "mission_type": "software-dev", "actor": actor,
-            }, lamport_clock=40),
-        ]
+class TestDeterminism:
+    """Exhaustive check of reducer determinism across physical orderings."""
 
-        canonical = reduce_mission_next_events(events)
+    _canonical = reduce_mission_next_events(_DETERMINISM_EVENTS)
 
-        shuffled = list(events)
-        rng_inst.shuffle(shuffled)
+    @pytest.mark.parametrize(
+        "perm", list(itertools.permutations(range(len(_DETERMINISM_EVENTS))))
+    )
+    def test_deterministic_across_permutations(self, perm: tuple[int, ...]) -> None:
+        shuffled = [_DETERMINISM_EVENTS[i] for i in perm]
         result = reduce_mission_next_events(shuffled)
 
+        canonical = self._canonical
         assert result.run_id == canonical.run_id
         assert result.run_status == canonical.run_status
         assert result.completed_steps == canonical.completed_steps
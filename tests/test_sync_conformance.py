@@ -8,16 +8,21 @@ Covers:
 """
 from __future__ import annotations
 
+import difflib
 import json
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Dict, List
 
 import pytest
+from pydantic import TypeAdapter
 
 from spec_kitty_events.conformance import (
     load_fixtures,
     load_replay_stream,
     validate_event,
 )
+from spec_kitty_events.conformance.loader import FixtureCase
 from spec_kitty_events.models import Event
 from spec_kitty_events.sync import (
     ExternalReferenceLinkedPayload,
@@ -34,12 +39,24 @@ from spec_kitty_events.sync import (
 # ---------------------------------------------------------------------------
 
 _SYNC_CASES = load_fixtures("sync")
-_VALID_CASES = [c for c in _SYNC_CASES if c.expected_valid]
-_INVALID_CASES = [c for c in _SYNC_CASES if not c.expected_valid]
+_VALID_CASES: List[FixtureCase] = []
+_INVALID_CASES: List[FixtureCase] = []
 
 # Separate external-ref cases from sync-specific valid cases
-_EXTERNAL_REF_CASES = [c for c in _VALID_CASES if c.event_type == "ExternalReferenceLinked"]
-_SYNC_VALID_CASES = [c for c in _VALID_CASES if c.event_type != "ExternalReferenceLinked"]
+_EXTERNAL_REF_CASES: List[FixtureCase] = []
+_SYNC_VALID_CASES: List[FixtureCase] = []
+
+for _case in _SYNC_CASES:
+    if not _case.expected_valid:
+        _INVALID_CASES.append(_case)
+        continue
+    _VALID_CASES.append(_case)
+    if _case.event_type == "ExternalReferenceLinked":
+        _EXTERNAL_REF_CASES.append(_case)
+    else:
+        _SYNC_VALID_CASES.append(_case)
+
+_CASES_BY_ID: Dict[str, FixtureCase] = {c.id: c for c in _SYNC_CASES}
 
 _FIXTURES_DIR = (
     Path(__file__).parent.parent
@@ -50,17 +67,20 @@ _FIXTURES_DIR = (
 )
 
 
+@pytest.fixture
+def case(request: pytest.FixtureRequest) -> FixtureCase:
+    """Resolve a parametrized fixture id to its ``FixtureCase``."""
+    return _CASES_BY_ID[request.param]
+
+
 # ---------------------------------------------------------------------------
 # Section 1 -- Valid fixture validation (8 cases)
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.parametrize("case", _VALID_CASES, ids=[c.id for c in _VALID_CASES])
-def test_valid_fixture_passes_conformance(case: object) -> None:
+@pytest.mark.parametrize("case", [c.id for c in _VALID_CASES], indirect=True)
+def test_valid_fixture_passes_conformance(case: FixtureCase) -> None:
     """All valid sync fixtures (including external-ref) must pass conformance validation."""
-    from spec_kitty_events.conformance.loader import FixtureCase
-
-    assert isinstance(case, FixtureCase)
     result = validate_event(case.payload, case.event_type, strict=True)
     assert result.valid, (
         f"Fixture {case.id} should be valid but got violations:\n"
@@ -74,12 +94,9 @@ def test_valid_fixture_passes_conformance(case: object) -> None:
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.parametrize("case", _INVALID_CASES, ids=[c.id for c in _INVALID_CASES])
-def test_invalid_fixture_fails_conformance(case: object) -> None:
+@pytest.mark.parametrize("case", [c.id for c in _INVALID_CASES], indirect=True)
+def test_invalid_fixture_fails_conformance(case: FixtureCase) -> None:
     """All invalid Sync fixtures must produce at least one model_violation."""
-    from spec_kitty_events.conformance.loader import FixtureCase
-
-    assert isinstance(case, FixtureCase)
     result = validate_event(case.payload, case.event_type, strict=True)
     assert not result.valid, (
         f"Fixture {case.id} should be invalid but passed validation"
@@ -123,13 +140,10 @@ def test_external_ref_linked_case_count() -> None:
 
 
 @pytest.mark.parametrize(
-    "case", _EXTERNAL_REF_CASES, ids=[c.id for c in _EXTERNAL_REF_CASES]
+    "case", [c.id for c in _EXTERNAL_REF_CASES], indirect=True
 )
-def test_external_ref_linked_valid(case: object) -> None:
+def test_external_ref_linked_valid(case: FixtureCase) -> None:
     """Both ExternalReferenceLinked fixtures must pass conformance validation."""
-    from spec_kitty_events.conformance.loader import FixtureCase
-
-    assert isinstance(case, FixtureCase)
     result = validate_event(case.payload, case.event_type, strict=True)
     assert result.valid, (
         f"ExternalReferenceLinked fixture {case.id} should be valid but got violations:\n"
@@ -142,49 +156,91 @@ def test_external_ref_linked_valid(case: object) -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_sync_replay_stream_validates_and_matches_golden() -> None:
-    """Each JSONL line validates; sync reducer output matches committed golden file."""
-    stream_id = "sync-ingest-lifecycle"
-    output_id = "sync-ingest-lifecycle-output"
+# Validates a whole replay stream in one core-schema call.
+_EVENTS_ADAPTER: TypeAdapter[List[Event]] = TypeAdapter(List[Event])
+
+_REPLAY_STREAM_ID = "sync-ingest-lifecycle"
+_REPLAY_OUTPUT_ID = "sync-ingest-lifecycle-output"
+
+
+@dataclass(frozen=True)
+class _SyncReplayBundle:
+    """Replay stream, its reduced state, and the committed golden output."""
+
+    raw: List[Dict[str, Any]]
+    actual: Dict[str, Any]
+    expected: Dict[str, Any]
+    golden_path: Path
 
-    raw = load_replay_stream(stream_id)
-    # Validate each event's payload
-    for event_dict in raw:
-        event_type = event_dict["event_type"]
-        payload = event_dict["payload"]
-        result = validate_event(payload, event_type, strict=True)
-        assert result.valid, (
-            f"Event {event_dict['event_id']!r} in stream {stream_id!r} "
-            f"failed validation: {result.model_violations}"
-        )
+
+@pytest.fixture(scope="module")
+def sync_replay_bundle() -> _SyncReplayBundle:
+    """Load, build and reduce the sync replay stream once for all replay tests."""
+    raw = load_replay_stream(_REPLAY_STREAM_ID)
 
     # Reduce to state
-    events = [Event(**e) for e in raw]
+    events = _EVENTS_ADAPTER.validate_python(raw)
     state = reduce_sync_events(events)
     actual = state.model_dump(mode="json")
-    # Normalize seen_delivery_pairs for comparison (frozenset -> sorted list)
-    actual["seen_delivery_pairs"] = sorted(
-        [list(p) for p in actual["seen_delivery_pairs"]]
-    )
+    # Normalize seen_delivery_pairs for comparison: JSON mode already dumps the
+    # frozenset as a list of [delivery_id, fingerprint] lists, so only sort it.
+    actual["seen_delivery_pairs"] = sorted(actual["seen_delivery_pairs"])
 
     # Load golden file from manifest
     from spec_kitty_events.conformance.loader import (
         _FIXTURES_DIR as FIXTURES_DIR,
-        _MANIFEST_PATH,
+        _manifest_index,
     )
 
-    manifest = json.loads(_MANIFEST_PATH.read_text())
-    golden_entry = next(
-        (e for e in manifest["fixtures"] if e["id"] == output_id), None
+    golden_entry = _manifest_index().get(_REPLAY_OUTPUT_ID)
+    assert golden_entry is not None, (
+        f"Golden manifest entry not found: {_REPLAY_OUTPUT_ID}"
     )
-    assert golden_entry is not None, f"Golden manifest entry not found: {output_id}"
     golden_path = FIXTURES_DIR / golden_entry["path"]
     assert golden_path.exists(), f"Golden file not found: {golden_path}"
     expected = json.loads(golden_path.read_text())
+    return _SyncReplayBundle(
+        raw=raw, actual=actual, expected=expected, golden_path=golden_path
+    )
+
+
+def _json_diff(expected: Dict[str, Any], actual: Dict[str, Any]) -> str:
+    """Unified diff of two JSON documents in canonical (sorted-key) form."""
+    return "\n".join(
+        difflib.unified_diff(
+            json.dumps(expected, sort_keys=True, indent=2).splitlines(),
+            json.dumps(actual, sort_keys=True, indent=2).splitlines(),
+            fromfile="expected",
+            tofile="actual",
+            lineterm="",
+        )
+    )
+
+
+def test_sync_replay_stream_events_validate(
+    sync_replay_bundle: _SyncReplayBundle,
+) -> None:
+    """Each JSONL line in the sync replay stream passes conformance validation."""
+    for event_dict in sync_replay_bundle.raw:
+        event_type = event_dict["event_type"]
+        payload = event_dict["payload"]
+        result = validate_event(payload, event_type, strict=True)
+        assert result.valid, (
+            f"Event {event_dict['event_id']!r} in stream {_REPLAY_STREAM_ID!r} "
+            f"failed validation: {result.model_violations}"
+        )
+
+
+def test_sync_replay_reducer_matches_golden(
+    sync_replay_bundle: _SyncReplayBundle,
+) -> None:
+    """Sync reducer output matches the committed golden file."""
+    actual = sync_replay_bundle.actual
+    expected = sync_replay_bundle.expected
+    # The message (a unified diff) is only built when the comparison fails.
     assert actual == expected, (
-        f"Reducer output for {stream_id!r} does not match golden file {golden_path}.\n"
-        f"Actual: {json.dumps(actual, sort_keys=True, indent=2)}\n"
-        f"Expected: {json.dumps(expected, sort_keys=True, indent=2)}"
+        f"Reducer output for {_REPLAY_STREAM_ID!r} does not match golden file "
+        f"{sync_replay_bundle.golden_path}:\n" + _json_diff(expected, actual)
     )
 
 
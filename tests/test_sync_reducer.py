@@ -6,12 +6,12 @@ cumulative count correctness, and deterministic ordering.
 """
 from __future__ import annotations
 
+import itertools
 import uuid
 from datetime import datetime, timezone
 from typing import Any
 
 import pytest
-from ulid import ULID
 
 from spec_kitty_events.sync import (
     SYNC_DEAD_LETTERED,
@@ -27,26 +27,42 @@ from spec_kitty_events.models import Event
 
 _PROJECT_UUID = uuid.UUID("aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee")
 _NOW = datetime(2026, 2, 27, 12, 0, 0, tzinfo=timezone.utc)
+_NOW_ISO = _NOW.isoformat()
+
+# Per-second timestamps (and their ISO-8601 forms) within the _NOW minute,
+# indexed by lamport value.
+_TS_BY_SEC = tuple(_NOW.replace(second=sec) for sec in range(60))
+_ISO_BY_SEC = tuple(ts.isoformat() for ts in _TS_BY_SEC)
+
+
+def _timestamp(sec: int) -> datetime:
+    """Timestamp for second ``sec`` of the _NOW minute."""
+    assert 0 <= sec < 60, f"second out of range: {sec}"
+    return _TS_BY_SEC[sec]
+
+
+def _recorded_at(sec: int) -> str:
+    """ISO-8601 ``recorded_at`` for second ``sec`` of the _NOW minute."""
+    assert 0 <= sec < 60, f"second out of range: {sec}"
+    return _ISO_BY_SEC[sec]
+
+
+# Tests only need unique, well-formed IDs, not real ULIDs (no urandom/base32).
+_ID_COUNTER = itertools.count(1)
+
+
+def _fake_ulid() -> str:
+    """Return a unique 26-char ID accepted by the Event ULID format check."""
+    return f"{next(_ID_COUNTER):026X}"
 
 
 # ── Payload helpers ────────────────────────────────────────────────────────────
 
 
-def _base_payload(
-    delivery_id: str = "del-001",
-    fingerprint: str = "fp-abc123",
-    lamport_offset: int = 0,
-) -> dict[str, Any]:
-    """Return a valid sync payload dict with idempotency base fields."""
-    return {
-        "delivery_id": delivery_id,
-        "source_event_fingerprint": fingerprint,
-        "connector_id": "conn-001",
-        "mission_id": "m-001",
-        "recorded_at": datetime(
-            2026, 2, 27, 12, 0, lamport_offset, tzinfo=timezone.utc
-        ).isoformat(),
-    }
+_BASE_PAYLOAD: dict[str, Any] = {
+    "connector_id": "conn-001",
+    "mission_id": "m-001",
+}
 
 
 def _event(
@@ -56,32 +72,75 @@ def _event(
     lamport: int = 1,
     event_id: str | None = None,
 ) -> Event:
-    """Factory for constructing test Event instances."""
-    return Event(
-        event_id=event_id or str(ULID()),
+    """Factory for constructing test Event instances.
+
+    Envelope fields are known-valid, so validation is skipped via
+    ``model_construct``; payloads are still validated by the reducer.
+    """
+    return Event.model_construct(
+        event_id=event_id or _fake_ulid(),
         event_type=event_type,
         aggregate_id="sync/conn-001",
         payload=payload_dict,
-        timestamp=datetime(2026, 2, 27, 12, 0, lamport, tzinfo=timezone.utc),
+        timestamp=_timestamp(lamport),
         build_id="test-build",
         node_id="node-1",
         lamport_clock=lamport,
         project_uuid=_PROJECT_UUID,
-        correlation_id=str(ULID()),
+        correlation_id=_fake_ulid(),
     )
 
 
 # ── Named event factories ─────────────────────────────────────────────────────
 
+# Per-event-type payload templates; factories merge in the per-call fields.
+_ACCEPTED_TEMPLATE: dict[str, Any] = {
+    **_BASE_PAYLOAD,
+    "ingest_batch_id": "batch-001",
+    "ingested_count": 10,
+}
+_REJECTED_TEMPLATE: dict[str, Any] = {
+    **_BASE_PAYLOAD,
+    "rejection_reason": "Schema mismatch",
+    "rejected_payload_ref": "s3://bucket/rejected/001.json",
+}
+_RETRY_TEMPLATE: dict[str, Any] = {
+    **_BASE_PAYLOAD,
+    "retry_attempt": 1,
+    "max_retries": 3,
+    "next_retry_at": _NOW_ISO,
+}
+_DEAD_LETTERED_TEMPLATE: dict[str, Any] = {
+    **_BASE_PAYLOAD,
+    "failure_reason": "Max retries exceeded",
+    "total_attempts": 3,
+    "dead_letter_ref": "dlq://bucket/dead/001.json",
+}
+_REPLAY_TEMPLATE: dict[str, Any] = {
+    **_BASE_PAYLOAD,
+    "replay_id": "replay-001",
+    "replayed_count": 100,
+    "replay_source": "archive-2026-02",
+}
+
+
+def _from_template(
+    template: dict[str, Any], delivery_id: str, fingerprint: str, lamport: int
+) -> dict[str, Any]:
+    """Merge the idempotency fields for one event into a payload template."""
+    return template | {
+        "delivery_id": delivery_id,
+        "source_event_fingerprint": fingerprint,
+        "recorded_at": _recorded_at(lamport),
+    }
+
 
 def _accepted_event(
     lamport: int = 1,
     delivery_id: str = "del-001",
     fingerprint: str = "fp-abc123",
 ) -> Event:
-    d = _base_payload(delivery_id, fingerprint, lamport)
-    d["ingest_batch_id"] = "batch-001"
-    d["ingested_count"] = 10
+    d = _from_template(_ACCEPTED_TEMPLATE, delivery_id, fingerprint, lamport)
     return _event(SYNC_INGEST_ACCEPTED, d, lamport=lamport)
 
 
@@ -90,9 +149,7 @@ def _rejected_event(
     delivery_id: str = "del-002",
     fingerprint: str = "fp-def456",
 ) -> Event:
-    d = _base_payload(delivery_id, fingerprint, lamport)
-    d["rejection_reason"] = "Schema mismatch"
-    d["rejected_payload_ref"] = "s3://bucket/rejected/001.json"
+    d = _from_template(_REJECTED_TEMPLATE, delivery_id, fingerprint, lamport)
     return _event(SYNC_INGEST_REJECTED, d, lamport=lamport)
 
 
@@ -101,10 +158,7 @@ def _retry_event(
     delivery_id: str = "del-003",
     fingerprint: str = "fp-ghi789",
 ) -> Event:
-    d = _base_payload(delivery_id, fingerprint, lamport)
-    d["retry_attempt"] = 1
-    d["max_retries"] = 3
-    d["next_retry_at"] = _NOW.isoformat()
+    d = _from_template(_RETRY_TEMPLATE, delivery_id, fingerprint, lamport)
     return _event(SYNC_RETRY_SCHEDULED, d, lamport=lamport)
 
 
@@ -113,10 +167,7 @@ def _dead_lettered_event(
     delivery_id: str = "del-003",
     fingerprint: str = "fp-jkl012",
 ) -> Event:
-    d = _base_payload(delivery_id, fingerprint, lamport)
-    d["failure_reason"] = "Max retries exceeded"
-    d["total_attempts"] = 3
-    d["dead_letter_ref"] = "dlq://bucket/dead/001.json"
+    d = _from_template(_DEAD_LETTERED_TEMPLATE, delivery_id, fingerprint, lamport)
     return _event(SYNC_DEAD_LETTERED, d, lamport=lamport)
 
 
@@ -125,10 +176,7 @@ def _replay_event(
     delivery_id: str = "del-004",
     fingerprint: str = "fp-mno345",
 ) -> Event:
-    d = _base_payload(delivery_id, fingerprint, lamport)
-    d["replay_id"] = "replay-001"
-    d["replayed_count"] = 100
-    d["replay_source"] = "archive-2026-02"
+    d = _from_template(_REPLAY_TEMPLATE, delivery_id, fingerprint, lamport)
     return _event(SYNC_REPLAY_COMPLETED, d, lamport=lamport)
 
 
@@ -274,6 +322,28 @@ def test_deterministic_with_reversed_input() -> None:
     assert forward == reverse
 
 
+def test_deterministic_tiebreak_on_event_id() -> None:
+    """Equal (lamport_clock, timestamp) events are ordered by event_id."""
+    e1 = _event(
+        SYNC_INGEST_ACCEPTED,
+        _from_template(_ACCEPTED_TEMPLATE, "d1", "f1", 1)
+        | {"ingest_batch_id": "b1", "ingested_count": 1},
+        lamport=1,
+        event_id="01AAAAAAAAAAAAAAAAAAAAAAAA",
+    )
+    e2 = _event(
+        SYNC_INGEST_REJECTED,
+        _from_template(_REJECTED_TEMPLATE, "d2", "f2", 1)
+        | {"rejected_payload_ref": "s3://bucket/rejected/002.json"},
+        lamport=1,
+        event_id="01BBBBBBBBBBBBBBBBBBBBBBBB",
+    )
+    forward = reduce_sync_events([e1, e2])
+    reverse = reduce_sync_events([e2, e1])
+    assert forward == reverse
+    assert [entry[0] for entry in forward.outcome_log] == [e1.event_id, e2.event_id]
+
+
 # ── Tests: Malformed payload ──────────────────────────────────────────────────
 
 
@@ -301,7 +371,7 @@ def test_malformed_payload_does_not_crash() -> None:
 
 def test_non_sync_events_filtered_silently() -> None:
     non_sync = Event(
-        event_id=str(ULID()),
+        event_id=_fake_ulid(),
         event_type="MissionStarted",
         aggregate_id="sync/conn-001",
         payload={"some": "data"},
@@ -310,7 +380,7 @@ def test_non_sync_events_filtered_silently() -> None:
         node_id="node-1",
         lamport_clock=1,
         project_uuid=_PROJECT_UUID,
-        correlation_id=str(ULID()),
+        correlation_id=_fake_ulid(),
     )
     events = [
         _accepted_event(2, delivery_id="d1", fingerprint="f1"),
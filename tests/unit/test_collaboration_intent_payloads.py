@@ -1,8 +1,10 @@
 """Unit tests for collaboration intent, focus, and execution payload models."""
 
-from __future__ import annotations
+import functools
+from typing import Any, TypeVar
 
 import pytest
+from pydantic import BaseModel, TypeAdapter
 from pydantic import ValidationError as PydanticValidationError
 
 from spec_kitty_events.collaboration import (
@@ -13,6 +15,80 @@ from spec_kitty_events.collaboration import (
     PromptStepExecutionStartedPayload,
 )
 
+_M = TypeVar("_M", bound=BaseModel)
+
+
+@functools.lru_cache(maxsize=256)
+def _ft(target_type: str, target_id: str) -> FocusTarget:
+    """Shared FocusTarget instance (frozen and hashable, so safe to reuse)."""
+    return FocusTarget(target_type=target_type, target_id=target_id)  # type: ignore[arg-type]
+
+
+# One list adapter per payload class: a batch round-trips in a single
+# dump/validate call instead of one model_validate() per instance.
+_LIST_ADAPTERS: dict[type[BaseModel], TypeAdapter[list[Any]]] = {
+    cls: TypeAdapter(list[cls])  # type: ignore[valid-type]
+    for cls in (
+        DriveIntentSetPayload,
+        FocusChangedPayload,
+        PromptStepExecutionStartedPayload,
+        PromptStepExecutionCompletedPayload,
+    )
+}
+
+
+# Validates the ``intent`` Literal alone, without building a payload.
+_INTENT_ADAPTER: TypeAdapter[str] = TypeAdapter(
+    DriveIntentSetPayload.model_fields["intent"].annotation
+)
+
+
+def _round_trip(originals: list[_M]) -> list[_M]:
+    """Dump a batch of same-class payloads and validate it back."""
+    adapter = _LIST_ADAPTERS[type(originals[0])]
+    restored: list[_M] = adapter.validate_python(adapter.dump_python(originals))
+    return restored
+
+
+# ── Shared instances (frozen-assignment tests; never mutated) ─────────────
+
+
+@pytest.fixture(scope="module")
+def drive_intent_payload() -> DriveIntentSetPayload:
+    return DriveIntentSetPayload(
+        participant_id="p-004",
+        mission_id="m-400",
+        intent="active",
+    )
+
+
+@pytest.fixture(scope="module")
+def focus_changed_payload() -> FocusChangedPayload:
+    return FocusChangedPayload(
+        participant_id="p-016",
+        mission_id="m-160",
+        focus_target=_ft("wp", "WP01"),
+    )
+
+
+@pytest.fixture(scope="module")
+def step_started_payload() -> PromptStepExecutionStartedPayload:
+    return PromptStepExecutionStartedPayload(
+        participant_id="p-022",
+        mission_id="m-220",
+        step_id="step-3",
+    )
+
+
+@pytest.fixture(scope="module")
+def step_completed_payload() -> PromptStepExecutionCompletedPayload:
+    return PromptStepExecutionCompletedPayload(
+        participant_id="p-034",
+        mission_id="m-340",
+        step_id="step-5",
+        outcome="success",
+    )
+
 
 # ── DriveIntentSetPayload ──────────────────────────────────────────────────
 
@@ -40,46 +116,23 @@ class TestDriveIntentSetPayload:
 
     def test_invalid_intent_rejected(self) -> None:
         with pytest.raises(PydanticValidationError):
-            DriveIntentSetPayload(
-                participant_id="p-003",
-                mission_id="m-300",
-                intent="paused",  # type: ignore[arg-type]
-            )
+            _INTENT_ADAPTER.validate_python("paused")
 
-    def test_frozen_rejects_assignment(self) -> None:
-        payload = DriveIntentSetPayload(
-            participant_id="p-004",
-            mission_id="m-400",
-            intent="active",
-        )
+    def test_frozen_rejects_assignment(self, drive_intent_payload: DriveIntentSetPayload) -> None:
+        payload = drive_intent_payload
         with pytest.raises(PydanticValidationError):
             payload.intent = "inactive"  # type: ignore[misc]
 
-    def test_empty_participant_id_rejected(self) -> None:
-        with pytest.raises(PydanticValidationError):
-            DriveIntentSetPayload(
-                participant_id="",
-                mission_id="m-500",
-                intent="active",
-            )
-
-    def test_empty_mission_id_rejected(self) -> None:
-        with pytest.raises(PydanticValidationError):
+    def test_round_trip_via_model_dump_validate(self) -> None:
+        originals = [
             DriveIntentSetPayload(
-                participant_id="p-005",
-                mission_id="",
-                intent="active",
+                participant_id="p-006",
+                mission_id="m-600",
+                intent=intent,
             )
-
-    def test_round_trip_via_model_dump_validate(self) -> None:
-        original = DriveIntentSetPayload(
-            participant_id="p-006",
-            mission_id="m-600",
-            intent="inactive",
-        )
-        data = original.model_dump()
-        restored = DriveIntentSetPayload.model_validate(data)
-        assert restored == original
+            for intent in ("active", "inactive")
+        ]
+        assert _round_trip(originals) == originals
 
     def test_model_dump_produces_dict(self) -> None:
         payload = DriveIntentSetPayload(
@@ -88,7 +141,7 @@ class TestDriveIntentSetPayload:
             intent="active",
         )
         dumped = payload.model_dump()
-        assert isinstance(dumped, dict)
+        assert type(dumped) is dict
         assert dumped["participant_id"] == "p-007"
         assert dumped["mission_id"] == "m-700"
         assert dumped["intent"] == "active"
@@ -101,7 +154,7 @@ class TestFocusChangedPayload:
     """Tests for the FocusChangedPayload model."""
 
     def test_valid_with_nested_focus_target(self) -> None:
-        target = FocusTarget(target_type="wp", target_id="WP01")
+        target = _ft("wp", "WP01")
         payload = FocusChangedPayload(
             participant_id="p-010",
             mission_id="m-100",
@@ -114,13 +167,13 @@ class TestFocusChangedPayload:
         payload = FocusChangedPayload(
             participant_id="p-011",
             mission_id="m-110",
-            focus_target=FocusTarget(target_type="step", target_id="step-1"),
+            focus_target=_ft("step", "step-1"),
         )
         assert payload.previous_focus_target is None
 
     def test_previous_focus_target_accepted(self) -> None:
-        prev = FocusTarget(target_type="file", target_id="src/old.py")
-        curr = FocusTarget(target_type="file", target_id="src/new.py")
+        prev = _ft("file", "src/old.py")
+        curr = _ft("file", "src/new.py")
         payload = FocusChangedPayload(
             participant_id="p-012",
             mission_id="m-120",
@@ -131,16 +184,15 @@ class TestFocusChangedPayload:
         assert payload.previous_focus_target.target_id == "src/old.py"
 
     def test_round_trip_preserves_nested_model(self) -> None:
-        prev = FocusTarget(target_type="wp", target_id="WP01")
-        curr = FocusTarget(target_type="wp", target_id="WP02")
+        prev = _ft("wp", "WP01")
+        curr = _ft("wp", "WP02")
         original = FocusChangedPayload(
             participant_id="p-013",
             mission_id="m-130",
             focus_target=curr,
             previous_focus_target=prev,
         )
-        data = original.model_dump()
-        restored = FocusChangedPayload.model_validate(data)
+        (restored,) = _round_trip([original])
         assert restored == original
         assert restored.focus_target.target_id == "WP02"
         assert restored.previous_focus_target is not None
@@ -150,10 +202,9 @@ class TestFocusChangedPayload:
         original = FocusChangedPayload(
             participant_id="p-014",
             mission_id="m-140",
-            focus_target=FocusTarget(target_type="step", target_id="step-5"),
+            focus_target=_ft("step", "step-5"),
         )
-        data = original.model_dump()
-        restored = FocusChangedPayload.model_validate(data)
+        (restored,) = _round_trip([original])
         assert restored == original
         assert restored.previous_focus_target is None
 
@@ -161,38 +212,18 @@ class TestFocusChangedPayload:
         payload = FocusChangedPayload(
             participant_id="p-015",
             mission_id="m-150",
-            focus_target=FocusTarget(target_type="file", target_id="README.md"),
-            previous_focus_target=FocusTarget(target_type="wp", target_id="WP03"),
+            focus_target=_ft("file", "README.md"),
+            previous_focus_target=_ft("wp", "WP03"),
         )
         dumped = payload.model_dump()
         assert dumped["focus_target"] == {"target_type": "file", "target_id": "README.md"}
         assert dumped["previous_focus_target"] == {"target_type": "wp", "target_id": "WP03"}
 
-    def test_frozen_rejects_assignment(self) -> None:
-        payload = FocusChangedPayload(
-            participant_id="p-016",
-            mission_id="m-160",
-            focus_target=FocusTarget(target_type="wp", target_id="WP01"),
-        )
+    def test_frozen_rejects_assignment(self, focus_changed_payload: FocusChangedPayload) -> None:
+        payload = focus_changed_payload
         with pytest.raises(PydanticValidationError):
             payload.mission_id = "changed"  # type: ignore[misc]
 
-    def test_empty_participant_id_rejected(self) -> None:
-        with pytest.raises(PydanticValidationError):
-            FocusChangedPayload(
-                participant_id="",
-                mission_id="m-170",
-                focus_target=FocusTarget(target_type="wp", target_id="WP01"),
-            )
-
-    def test_empty_mission_id_rejected(self) -> None:
-        with pytest.raises(PydanticValidationError):
-            FocusChangedPayload(
-                participant_id="p-017",
-                mission_id="",
-                focus_target=FocusTarget(target_type="wp", target_id="WP01"),
-            )
-
 
 # ── PromptStepExecutionStartedPayload ─────────────────────────────────────
 
@@ -223,39 +254,11 @@ class TestPromptStepExecutionStartedPayload:
         assert payload.wp_id is None
         assert payload.step_description is None
 
-    def test_frozen_rejects_assignment(self) -> None:
-        payload = PromptStepExecutionStartedPayload(
-            participant_id="p-022",
-            mission_id="m-220",
-            step_id="step-3",
-        )
+    def test_frozen_rejects_assignment(self, step_started_payload: PromptStepExecutionStartedPayload) -> None:
+        payload = step_started_payload
         with pytest.raises(PydanticValidationError):
             payload.step_id = "changed"  # type: ignore[misc]
 
-    def test_empty_participant_id_rejected(self) -> None:
-        with pytest.raises(PydanticValidationError):
-            PromptStepExecutionStartedPayload(
-                participant_id="",
-                mission_id="m-230",
-                step_id="step-4",
-            )
-
-    def test_empty_mission_id_rejected(self) -> None:
-        with pytest.raises(PydanticValidationError):
-            PromptStepExecutionStartedPayload(
-                participant_id="p-023",
-                mission_id="",
-                step_id="step-4",
-            )
-
-    def test_empty_step_id_rejected(self) -> None:
-        with pytest.raises(PydanticValidationError):
-            PromptStepExecutionStartedPayload(
-                participant_id="p-024",
-                mission_id="m-240",
-                step_id="",
-            )
-
     def test_round_trip_via_model_dump_validate(self) -> None:
         original = PromptStepExecutionStartedPayload(
             participant_id="p-025",
@@ -264,9 +267,7 @@ class TestPromptStepExecutionStartedPayload:
             wp_id="WP03",
             step_description="Build artifacts",
         )
-        data = original.model_dump()
-        restored = PromptStepExecutionStartedPayload.model_validate(data)
-        assert restored == original
+        assert _round_trip([original]) == [original]
 
     def test_round_trip_without_optionals(self) -> None:
         original = PromptStepExecutionStartedPayload(
@@ -274,8 +275,7 @@ class TestPromptStepExecutionStartedPayload:
             mission_id="m-260",
             step_id="step-6",
         )
-        data = original.model_dump()
-        restored = PromptStepExecutionStartedPayload.model_validate(data)
+        (restored,) = _round_trip([original])
         assert restored == original
         assert restored.wp_id is None
         assert restored.step_description is None
@@ -287,32 +287,15 @@ class TestPromptStepExecutionStartedPayload:
 class TestPromptStepExecutionCompletedPayload:
     """Tests for the PromptStepExecutionCompletedPayload model."""
 
-    def test_valid_success_outcome(self) -> None:
+    @pytest.mark.parametrize("outcome", ["success", "failure", "skipped"])
+    def test_valid_outcome(self, outcome: str) -> None:
         payload = PromptStepExecutionCompletedPayload(
             participant_id="p-030",
             mission_id="m-300",
             step_id="step-1",
-            outcome="success",
-        )
-        assert payload.outcome == "success"
-
-    def test_valid_failure_outcome(self) -> None:
-        payload = PromptStepExecutionCompletedPayload(
-            participant_id="p-031",
-            mission_id="m-310",
-            step_id="step-2",
-            outcome="failure",
-        )
-        assert payload.outcome == "failure"
-
-    def test_valid_skipped_outcome(self) -> None:
-        payload = PromptStepExecutionCompletedPayload(
-            participant_id="p-032",
-            mission_id="m-320",
-            step_id="step-3",
-            outcome="skipped",
+            outcome=outcome,  # type: ignore[arg-type]
         )
-        assert payload.outcome == "skipped"
+        assert payload.outcome == outcome
 
     def test_invalid_outcome_rejected(self) -> None:
         with pytest.raises(PydanticValidationError):
@@ -323,13 +306,8 @@ class TestPromptStepExecutionCompletedPayload:
                 outcome="timeout",  # type: ignore[arg-type]
             )
 
-    def test_frozen_rejects_assignment(self) -> None:
-        payload = PromptStepExecutionCompletedPayload(
-            participant_id="p-034",
-            mission_id="m-340",
-            step_id="step-5",
-            outcome="success",
-        )
+    def test_frozen_rejects_assignment(self, step_completed_payload: PromptStepExecutionCompletedPayload) -> None:
+        payload = step_completed_payload
         with pytest.raises(PydanticValidationError):
             payload.outcome = "failure"  # type: ignore[misc]
 
@@ -352,44 +330,18 @@ class TestPromptStepExecutionCompletedPayload:
         )
         assert payload.wp_id == "WP02"
 
-    def test_empty_participant_id_rejected(self) -> None:
-        with pytest.raises(PydanticValidationError):
-            PromptStepExecutionCompletedPayload(
-                participant_id="",
-                mission_id="m-370",
-                step_id="step-8",
-                outcome="success",
-            )
-
-    def test_empty_mission_id_rejected(self) -> None:
-        with pytest.raises(PydanticValidationError):
-            PromptStepExecutionCompletedPayload(
-                participant_id="p-037",
-                mission_id="",
-                step_id="step-8",
-                outcome="success",
-            )
-
-    def test_empty_step_id_rejected(self) -> None:
-        with pytest.raises(PydanticValidationError):
+    def test_round_trip_via_model_dump_validate(self) -> None:
+        originals = [
             PromptStepExecutionCompletedPayload(
-                participant_id="p-038",
-                mission_id="m-380",
-                step_id="",
-                outcome="success",
+                participant_id="p-039",
+                mission_id="m-390",
+                step_id="step-9",
+                wp_id="WP05",
+                outcome=outcome,
             )
-
-    def test_round_trip_via_model_dump_validate(self) -> None:
-        original = PromptStepExecutionCompletedPayload(
-            participant_id="p-039",
-            mission_id="m-390",
-            step_id="step-9",
-            wp_id="WP05",
-            outcome="skipped",
-        )
-        data = original.model_dump()
-        restored = PromptStepExecutionCompletedPayload.model_validate(data)
-        assert restored == original
+            for outcome in ("success", "failure", "skipped")
+        ]
+        assert _round_trip(originals) == originals
 
     def test_round_trip_without_wp_id(self) -> None:
         original = PromptStepExecutionCompletedPayload(
@@ -398,19 +350,59 @@ class TestPromptStepExecutionCompletedPayload:
             step_id="step-10",
             outcome="success",
         )
-        data = original.model_dump()
-        restored = PromptStepExecutionCompletedPayload.model_validate(data)
+        (restored,) = _round_trip([original])
         assert restored == original
         assert restored.wp_id is None
 
-    def test_model_dump_produces_dict(self) -> None:
+    def test_field_values_stored(self) -> None:
         payload = PromptStepExecutionCompletedPayload(
             participant_id="p-041",
             mission_id="m-410",
             step_id="step-11",
             outcome="failure",
         )
-        dumped = payload.model_dump()
-        assert isinstance(dumped, dict)
-        assert dumped["outcome"] == "failure"
-        assert dumped["step_id"] == "step-11"
+        assert payload.outcome == "failure"
+        assert payload.step_id == "step-11"
+
+
+# ── Required identifier fields ────────────────────────────────────────────
+
+
+_EMPTY_FIELD_CASES: list[tuple[type[BaseModel], dict[str, Any], str]] = [
+    (DriveIntentSetPayload, {"intent": "active"}, "participant_id"),
+    (DriveIntentSetPayload, {"intent": "active"}, "mission_id"),
+    (FocusChangedPayload, {"focus_target": _ft("wp", "WP01")}, "participant_id"),
+    (FocusChangedPayload, {"focus_target": _ft("wp", "WP01")}, "mission_id"),
+    (PromptStepExecutionStartedPayload, {"step_id": "step-4"}, "participant_id"),
+    (PromptStepExecutionStartedPayload, {"step_id": "step-4"}, "mission_id"),
+    (PromptStepExecutionStartedPayload, {"step_id": "step-4"}, "step_id"),
+    (
+        PromptStepExecutionCompletedPayload,
+        {"step_id": "step-8", "outcome": "success"},
+        "participant_id",
+    ),
+    (
+        PromptStepExecutionCompletedPayload,
+        {"step_id": "step-8", "outcome": "success"},
+        "mission_id",
+    ),
+    (
+        PromptStepExecutionCompletedPayload,
+        {"step_id": "step-8", "outcome": "success"},
+        "step_id",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("cls", "base_kwargs", "field"),
+    _EMPTY_FIELD_CASES,
+    ids=[f"{cls.__name__}-{field}" for cls, _, field in _EMPTY_FIELD_CASES],
+)
+def test_empty_field_rejected(
+    cls: type[BaseModel], base_kwargs: dict[str, Any], field: str
+) -> None:
+    kwargs = {"participant_id": "p-005", "mission_id": "m-500", **base_kwargs}
+    kwargs[field] = ""
+    with pytest.raises(PydanticValidationError):
+        cls(**kwargs)
@@ -1,14 +1,14 @@
 """Unit tests for collaboration event constants and identity models."""
 
-from __future__ import annotations
-
 from datetime import datetime, timezone
+from typing import ClassVar
 
 import pytest
 from pydantic import ValidationError as PydanticValidationError
 
 import json
 
+from spec_kitty_events import collaboration
 from spec_kitty_events.collaboration import (
     COLLABORATION_EVENT_TYPES,
     COMMENT_POSTED,
@@ -34,6 +34,32 @@ from spec_kitty_events.collaboration import (
 from spec_kitty_events.models import SpecKittyEventsError
 
 
+# Timestamp for tests where the exact bound_at value is irrelevant.
+_FIXED_TS = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+# ── Shared instances (frozen-assignment tests; never mutated) ────────────────
+
+
+@pytest.fixture(scope="module")
+def participant_identity() -> ParticipantIdentity:
+    return ParticipantIdentity(participant_id="p-004", participant_type="human")
+
+
+@pytest.fixture(scope="module")
+def auth_principal_binding() -> AuthPrincipalBinding:
+    return AuthPrincipalBinding(
+        auth_principal_id="auth-456",
+        participant_id="p-002",
+        bound_at=_FIXED_TS,
+    )
+
+
+@pytest.fixture(scope="module")
+def external_refs() -> ParticipantExternalRefs:
+    return ParticipantExternalRefs(slack_user_id="U123")
+
+
 # ── Constants ────────────────────────────────────────────────────────────────
 
 
@@ -56,6 +82,7 @@ class TestConstants:
         DECISION_CAPTURED,
         SESSION_LINKED,
     ]
+    EXPECTED_SET: ClassVar[frozenset[str]] = frozenset(ALL_CONSTANTS)
 
     def test_all_constants_are_strings(self) -> None:
         for c in self.ALL_CONSTANTS:
@@ -69,7 +96,7 @@ class TestConstants:
         assert len(COLLABORATION_EVENT_TYPES) == 14
 
     def test_frozenset_matches_constants(self) -> None:
-        assert COLLABORATION_EVENT_TYPES == frozenset(self.ALL_CONSTANTS)
+        assert COLLABORATION_EVENT_TYPES == self.EXPECTED_SET
 
     def test_no_duplicates_among_constants(self) -> None:
         assert len(self.ALL_CONSTANTS) == len(set(self.ALL_CONSTANTS))
@@ -78,20 +105,24 @@ class TestConstants:
         assert isinstance(COLLABORATION_EVENT_TYPES, frozenset)
 
     def test_expected_constant_values(self) -> None:
-        assert PARTICIPANT_INVITED == "ParticipantInvited"
-        assert PARTICIPANT_JOINED == "ParticipantJoined"
-        assert PARTICIPANT_LEFT == "ParticipantLeft"
-        assert PRESENCE_HEARTBEAT == "PresenceHeartbeat"
-        assert DRIVE_INTENT_SET == "DriveIntentSet"
-        assert FOCUS_CHANGED == "FocusChanged"
-        assert PROMPT_STEP_EXECUTION_STARTED == "PromptStepExecutionStarted"
-        assert PROMPT_STEP_EXECUTION_COMPLETED == "PromptStepExecutionCompleted"
-        assert CONCURRENT_DRIVER_WARNING == "ConcurrentDriverWarning"
-        assert POTENTIAL_STEP_COLLISION_DETECTED == "PotentialStepCollisionDetected"
-        assert WARNING_ACKNOWLEDGED == "WarningAcknowledged"
-        assert COMMENT_POSTED == "CommentPosted"
-        assert DECISION_CAPTURED == "DecisionCaptured"
-        assert SESSION_LINKED == "SessionLinked"
+        expected = {
+            "PARTICIPANT_INVITED": "ParticipantInvited",
+            "PARTICIPANT_JOINED": "ParticipantJoined",
+            "PARTICIPANT_LEFT": "ParticipantLeft",
+            "PRESENCE_HEARTBEAT": "PresenceHeartbeat",
+            "DRIVE_INTENT_SET": "DriveIntentSet",
+            "FOCUS_CHANGED": "FocusChanged",
+            "PROMPT_STEP_EXECUTION_STARTED": "PromptStepExecutionStarted",
+            "PROMPT_STEP_EXECUTION_COMPLETED": "PromptStepExecutionCompleted",
+            "CONCURRENT_DRIVER_WARNING": "ConcurrentDriverWarning",
+            "POTENTIAL_STEP_COLLISION_DETECTED": "PotentialStepCollisionDetected",
+            "WARNING_ACKNOWLEDGED": "WarningAcknowledged",
+            "COMMENT_POSTED": "CommentPosted",
+            "DECISION_CAPTURED": "DecisionCaptured",
+            "SESSION_LINKED": "SessionLinked",
+        }
+        actual = {name: getattr(collaboration, name) for name in expected}
+        assert actual == expected
 
 
 # ── ParticipantIdentity ─────────────────────────────────────────────────────
@@ -127,11 +158,10 @@ class TestParticipantIdentity:
         assert pid.display_name is None
         assert pid.session_id is None
 
-    def test_frozen_rejects_assignment(self) -> None:
-        pid = ParticipantIdentity(
-            participant_id="p-004",
-            participant_type="human",
-        )
+    def test_frozen_rejects_assignment(
+        self, participant_identity: ParticipantIdentity
+    ) -> None:
+        pid = participant_identity
         with pytest.raises(PydanticValidationError):
             pid.participant_id = "changed"  # type: ignore[misc]
 
@@ -166,7 +196,7 @@ class TestParticipantIdentity:
             participant_type="human",
         )
         dumped = pid.model_dump()
-        assert isinstance(dumped, dict)
+        assert type(dumped) is dict
         assert dumped["participant_id"] == "p-007"
         assert dumped["participant_type"] == "human"
 
@@ -188,12 +218,10 @@ class TestAuthPrincipalBinding:
         assert binding.participant_id == "p-001"
         assert binding.bound_at == now
 
-    def test_frozen_rejects_assignment(self) -> None:
-        binding = AuthPrincipalBinding(
-            auth_principal_id="auth-456",
-            participant_id="p-002",
-            bound_at=datetime.now(timezone.utc),
-        )
+    def test_frozen_rejects_assignment(
+        self, auth_principal_binding: AuthPrincipalBinding
+    ) -> None:
+        binding = auth_principal_binding
         with pytest.raises(PydanticValidationError):
             binding.auth_principal_id = "changed"  # type: ignore[misc]
 
@@ -202,7 +230,7 @@ class TestAuthPrincipalBinding:
             AuthPrincipalBinding(
                 auth_principal_id="",
                 participant_id="p-003",
-                bound_at=datetime.now(timezone.utc),
+                bound_at=_FIXED_TS,
             )
 
     def test_empty_participant_id_rejected(self) -> None:
@@ -210,7 +238,7 @@ class TestAuthPrincipalBinding:
             AuthPrincipalBinding(
                 auth_principal_id="auth-789",
                 participant_id="",
-                bound_at=datetime.now(timezone.utc),
+                bound_at=_FIXED_TS,
             )
 
     def test_bound_at_accepts_datetime(self) -> None:
@@ -239,18 +267,14 @@ class TestAuthPrincipalBinding:
 class TestFocusTarget:
     """Tests for the FocusTarget model."""
 
-    def test_valid_wp_target(self) -> None:
-        ft = FocusTarget(target_type="wp", target_id="WP01")
-        assert ft.target_type == "wp"
-        assert ft.target_id == "WP01"
-
-    def test_valid_step_target(self) -> None:
-        ft = FocusTarget(target_type="step", target_id="step-3")
-        assert ft.target_type == "step"
-
-    def test_valid_file_target(self) -> None:
-        ft = FocusTarget(target_type="file", target_id="src/main.py")
-        assert ft.target_type == "file"
+    @pytest.mark.parametrize(
+        ("target_type", "target_id"),
+        [("wp", "WP01"), ("step", "step-3"), ("file", "src/main.py")],
+    )
+    def test_valid_target(self, target_type: str, target_id: str) -> None:
+        ft = FocusTarget(target_type=target_type, target_id=target_id)  # type: ignore[arg-type]
+        assert ft.target_type == target_type
+        assert ft.target_id == target_id
 
     def test_frozen_rejects_assignment(self) -> None:
         ft = FocusTarget(target_type="wp", target_id="WP02")
@@ -387,24 +411,19 @@ class TestParticipantExternalRefs:
             ParticipantExternalRefs()
         assert "at least one" in str(exc_info.value).lower()
 
-    def test_rejects_empty_slack_user_id(self) -> None:
-        with pytest.raises(PydanticValidationError):
-            ParticipantExternalRefs(slack_user_id="")
-
-    def test_rejects_empty_slack_team_id(self) -> None:
+    @pytest.mark.parametrize(
+        "field", ["slack_user_id", "slack_team_id", "teamspace_member_id"]
+    )
+    def test_rejects_empty_id(self, field: str) -> None:
         with pytest.raises(PydanticValidationError):
-            ParticipantExternalRefs(slack_team_id="")
-
-    def test_rejects_empty_teamspace_member_id(self) -> None:
-        with pytest.raises(PydanticValidationError):
-            ParticipantExternalRefs(teamspace_member_id="")
+            ParticipantExternalRefs(**{field: ""})
 
     def test_forbids_extra_fields(self) -> None:
         with pytest.raises(PydanticValidationError):
             ParticipantExternalRefs(slack_user_id="U123", foo="bar")  # type: ignore[call-arg]
 
-    def test_frozen(self) -> None:
-        refs = ParticipantExternalRefs(slack_user_id="U123")
+    def test_frozen(self, external_refs: ParticipantExternalRefs) -> None:
+        refs = external_refs
         with pytest.raises(PydanticValidationError):
             refs.slack_user_id = "changed"  # type: ignore[misc]
 
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import Any
 
 import pytest
+from pydantic import BaseModel
 from pydantic import ValidationError as PydanticValidationError
 
 from spec_kitty_events.collaboration import (
@@ -18,62 +20,209 @@ from spec_kitty_events.collaboration import (
 )
 
 
+_NOW = datetime(2025, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
+_FS_P001 = frozenset(("p-001",))
+_FS_P001_P002 = frozenset(("p-001", "p-002"))
+_FS_P002_P003 = frozenset(("p-002", "p-003"))
+_FS_P004 = frozenset(("p-004",))
+_EXPECTED_FOCUS = {
+    "wp:WP03": _FS_P001,
+    "step:step-5": _FS_P002_P003,
+    "file:src/main.py": _FS_P004,
+}
+
+# Canonical constructor kwargs, shared read-only by fixtures and case tables.
+_ANOMALY_KW: dict[str, Any] = {
+    "event_id": "evt-001",
+    "event_type": "ParticipantJoined",
+    "reason": "Unknown participant in roster",
+}
+_WARNING_KW: dict[str, Any] = {
+    "warning_id": "warn-001",
+    "event_id": "evt-010",
+    "warning_type": "ConcurrentDriverWarning",
+    "participant_ids": ("p-001", "p-002"),
+}
+_DECISION_KW: dict[str, Any] = {
+    "decision_id": "dec-001",
+    "event_id": "evt-020",
+    "participant_id": "p-001",
+    "topic": "Step ordering",
+    "chosen_option": "sequential",
+    "referenced_warning_id": "warn-001",
+}
+_COMMENT_KW: dict[str, Any] = {
+    "comment_id": "cmt-001",
+    "event_id": "evt-030",
+    "participant_id": "p-001",
+    "content": "Looks good to me.",
+    "reply_to": "cmt-000",
+}
+
+
+# ── Shared fixtures ────────────────────────────────────────────────────────
+#
+# The models are frozen, so one instance of each can be shared read-only
+# across every test that only inspects it.
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _warm_pydantic_validators() -> None:
+    """Construct each output model once before the first test in this module.
+
+    Pydantic builds the core schemas at class creation; this only moves the
+    first-call costs (validator and serializer caches) out of whichever test
+    happens to run first.
+    """
+    identity = ParticipantIdentity(participant_id="warmup", participant_type="human")
+    target = FocusTarget(target_type="wp", target_id="WP00")
+    ReducedCollaborationState(
+        mission_id="warmup",
+        participants={"warmup": identity},
+        focus_by_participant={"warmup": target},
+        warnings=(
+            WarningEntry(
+                warning_id="warmup",
+                event_id="warmup",
+                warning_type="ConcurrentDriverWarning",
+                participant_ids=("warmup",),
+            ),
+        ),
+        decisions=(
+            DecisionEntry(
+                decision_id="warmup",
+                event_id="warmup",
+                participant_id="warmup",
+                topic="warmup",
+                chosen_option="warmup",
+            ),
+        ),
+        comments=(
+            CommentEntry(
+                comment_id="warmup",
+                event_id="warmup",
+                participant_id="warmup",
+                content="warmup",
+            ),
+        ),
+        anomalies=(
+            CollaborationAnomaly(
+                event_id="warmup", event_type="warmup", reason="warmup"
+            ),
+        ),
+    ).model_dump()
+
+
+def _make_populated_state() -> ReducedCollaborationState:
+    """Build a representative populated state for the shared fixture."""
+    p1 = ParticipantIdentity(
+        participant_id="p-001",
+        participant_type="human",
+        display_name="Alice",
+    )
+    p2 = ParticipantIdentity(
+        participant_id="p-002",
+        participant_type="llm_context",
+        display_name="Claude",
+    )
+    departed = ParticipantIdentity(
+        participant_id="p-003",
+        participant_type="human",
+        display_name="Bob",
+    )
+    focus_wp03 = FocusTarget(target_type="wp", target_id="WP03")
+
+    warning = WarningEntry(
+        warning_id="warn-001",
+        event_id="evt-100",
+        warning_type="ConcurrentDriverWarning",
+        participant_ids=("p-001", "p-002"),
+        acknowledgements={"p-001": "proceed"},
+    )
+    decision = DecisionEntry(
+        decision_id="dec-001",
+        event_id="evt-101",
+        participant_id="p-001",
+        topic="Step ordering",
+        chosen_option="sequential",
+        referenced_warning_id="warn-001",
+    )
+    comment = CommentEntry(
+        comment_id="cmt-001",
+        event_id="evt-102",
+        participant_id="p-002",
+        content="Acknowledged.",
+    )
+    anomaly = CollaborationAnomaly(
+        event_id="evt-103",
+        event_type="PresenceHeartbeat",
+        reason="Heartbeat from departed participant p-003",
+    )
+
+    return ReducedCollaborationState(
+        mission_id="mission-abc",
+        participants={"p-001": p1, "p-002": p2},
+        departed_participants={"p-003": departed},
+        presence={"p-001": _NOW, "p-002": _NOW},
+        active_drivers=_FS_P001,
+        focus_by_participant={"p-001": focus_wp03},
+        participants_by_focus={"wp:WP03": _FS_P001},
+        warnings=(warning,),
+        decisions=(decision,),
+        comments=(comment,),
+        active_executions={"p-001": ["step-1", "step-2"]},
+        linked_sessions={"p-002": ["sess-xyz"]},
+        anomalies=(anomaly,),
+        event_count=15,
+        last_processed_event_id="evt-103",
+    )
+
+
+@pytest.fixture(scope="session")
+def populated_state() -> ReducedCollaborationState:
+    return _make_populated_state()
+
+
+@pytest.fixture(scope="session")
+def empty_state() -> ReducedCollaborationState:
+    return ReducedCollaborationState(mission_id="mission-empty")
+
+
+@pytest.fixture(scope="class")
+def dumped_state(populated_state: ReducedCollaborationState) -> dict[str, Any]:
+    """One ``model_dump`` of the populated state; tests must not mutate it."""
+    return populated_state.model_dump()
+
+
+@pytest.fixture(scope="session")
+def anomaly_fixture() -> CollaborationAnomaly:
+    return CollaborationAnomaly(**_ANOMALY_KW)
+
+
+@pytest.fixture(scope="class")
+def dumped_anomaly(anomaly_fixture: CollaborationAnomaly) -> dict[str, Any]:
+    """One ``model_dump`` of the shared anomaly; tests must not mutate it."""
+    return anomaly_fixture.model_dump()
+
+
 # ── CollaborationAnomaly ───────────────────────────────────────────────────
 
 
 class TestCollaborationAnomaly:
     """Tests for the CollaborationAnomaly model."""
 
-    def test_valid_construction(self) -> None:
-        anomaly = CollaborationAnomaly(
-            event_id="evt-001",
-            event_type="ParticipantJoined",
-            reason="Unknown participant in roster",
-        )
-        assert anomaly.event_id == "evt-001"
-        assert anomaly.event_type == "ParticipantJoined"
-        assert anomaly.reason == "Unknown participant in roster"
-
-    def test_frozen_rejects_assignment(self) -> None:
-        anomaly = CollaborationAnomaly(
-            event_id="evt-002",
-            event_type="FocusChanged",
-            reason="Focus on unknown target",
-        )
-        with pytest.raises(PydanticValidationError):
-            anomaly.event_id = "changed"  # type: ignore[misc]
-
-    def test_field_access(self) -> None:
-        anomaly = CollaborationAnomaly(
-            event_id="evt-003",
-            event_type="DriveIntentSet",
-            reason="Duplicate drive intent",
-        )
+    def test_field_access(self, anomaly_fixture: CollaborationAnomaly) -> None:
+        anomaly = anomaly_fixture
         assert isinstance(anomaly.event_id, str)
         assert isinstance(anomaly.event_type, str)
         assert isinstance(anomaly.reason, str)
 
-    def test_round_trip_via_model_dump_validate(self) -> None:
-        original = CollaborationAnomaly(
-            event_id="evt-004",
-            event_type="PresenceHeartbeat",
-            reason="Heartbeat from departed participant",
-        )
-        data = original.model_dump()
-        restored = CollaborationAnomaly.model_validate(data)
-        assert restored == original
-
-    def test_model_dump_produces_dict(self) -> None:
-        anomaly = CollaborationAnomaly(
-            event_id="evt-005",
-            event_type="SessionLinked",
-            reason="Session already linked",
-        )
-        dumped = anomaly.model_dump()
-        assert isinstance(dumped, dict)
-        assert dumped["event_id"] == "evt-005"
-        assert dumped["event_type"] == "SessionLinked"
-        assert dumped["reason"] == "Session already linked"
+    def test_model_dump_produces_dict(self, dumped_anomaly: dict[str, Any]) -> None:
+        dumped = dumped_anomaly
+        assert type(dumped) is dict
+        assert dumped["event_id"] == "evt-001"
+        assert dumped["event_type"] == "ParticipantJoined"
+        assert dumped["reason"] == "Unknown participant in roster"
 
 
 # ── WarningEntry ───────────────────────────────────────────────────────────
@@ -82,19 +231,6 @@ class TestCollaborationAnomaly:
 class TestWarningEntry:
     """Tests for the WarningEntry model."""
 
-    def test_valid_construction(self) -> None:
-        warning = WarningEntry(
-            warning_id="warn-001",
-            event_id="evt-010",
-            warning_type="ConcurrentDriverWarning",
-            participant_ids=("p-001", "p-002"),
-        )
-        assert warning.warning_id == "warn-001"
-        assert warning.event_id == "evt-010"
-        assert warning.warning_type == "ConcurrentDriverWarning"
-        assert warning.participant_ids == ("p-001", "p-002")
-        assert warning.acknowledgements == {}
-
     def test_with_acknowledgements(self) -> None:
         warning = WarningEntry(
             warning_id="warn-002",
@@ -105,28 +241,6 @@ class TestWarningEntry:
         )
         assert warning.acknowledgements == {"p-003": "proceed"}
 
-    def test_frozen_rejects_assignment(self) -> None:
-        warning = WarningEntry(
-            warning_id="warn-003",
-            event_id="evt-012",
-            warning_type="ConcurrentDriverWarning",
-            participant_ids=("p-004",),
-        )
-        with pytest.raises(PydanticValidationError):
-            warning.warning_id = "changed"  # type: ignore[misc]
-
-    def test_round_trip_via_model_dump_validate(self) -> None:
-        original = WarningEntry(
-            warning_id="warn-004",
-            event_id="evt-013",
-            warning_type="PotentialStepCollisionDetected",
-            participant_ids=("p-005", "p-006"),
-            acknowledgements={"p-005": "abort", "p-006": "continue"},
-        )
-        data = original.model_dump()
-        restored = WarningEntry.model_validate(data)
-        assert restored == original
-
     def test_participant_ids_is_tuple(self) -> None:
         warning = WarningEntry(
             warning_id="warn-005",
@@ -148,138 +262,166 @@ class TestWarningEntry:
         assert isinstance(warning.acknowledgements, dict)
 
 
-# ── DecisionEntry ──────────────────────────────────────────────────────────
-
-
-class TestDecisionEntry:
-    """Tests for the DecisionEntry model."""
+# ── Valid construction ─────────────────────────────────────────────────────
+
+
+# (cls, kwargs, expected values of fields left at their defaults)
+_VALID_CONSTRUCTION_CASES: list[
+    tuple[type[BaseModel], dict[str, Any], dict[str, Any]]
+] = [
+    (CollaborationAnomaly, _ANOMALY_KW, {}),
+    (WarningEntry, _WARNING_KW, {"acknowledgements": {}}),
+    (DecisionEntry, _DECISION_KW, {}),
+    (
+        DecisionEntry,
+        {
+            "decision_id": "dec-002",
+            "event_id": "evt-021",
+            "participant_id": "p-002",
+            "topic": "Architecture pattern",
+            "chosen_option": "event-sourced",
+        },
+        {"referenced_warning_id": None},
+    ),
+    (CommentEntry, _COMMENT_KW, {}),
+    (
+        CommentEntry,
+        {
+            "comment_id": "cmt-002",
+            "event_id": "evt-031",
+            "participant_id": "p-002",
+            "content": "Starting implementation now.",
+        },
+        {"reply_to": None},
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("cls", "kwargs", "defaults"),
+    _VALID_CONSTRUCTION_CASES,
+    ids=[
+        "anomaly",
+        "warning",
+        "decision-with-warning-ref",
+        "decision-without-warning-ref",
+        "comment-with-reply",
+        "comment-without-reply",
+    ],
+)
+def test_valid_construction(
+    cls: type[BaseModel], kwargs: dict[str, Any], defaults: dict[str, Any]
+) -> None:
+    inst = cls(**kwargs)
+    for field, value in {**kwargs, **defaults}.items():
+        assert getattr(inst, field) == value, field
+
+
+# ── Round-trip (dump -> validate) ──────────────────────────────────────────
+
+
+_ROUND_TRIP_CASES: list[tuple[type[BaseModel], dict[str, Any]]] = [
+    (
+        CollaborationAnomaly,
+        {
+            "event_id": "evt-004",
+            "event_type": "PresenceHeartbeat",
+            "reason": "Heartbeat from departed participant",
+        },
+    ),
+    (
+        WarningEntry,
+        {
+            "warning_id": "warn-004",
+            "event_id": "evt-013",
+            "warning_type": "PotentialStepCollisionDetected",
+            "participant_ids": ("p-005", "p-006"),
+            "acknowledgements": {"p-005": "abort", "p-006": "continue"},
+        },
+    ),
+    (
+        DecisionEntry,
+        {
+            "decision_id": "dec-004",
+            "event_id": "evt-023",
+            "participant_id": "p-004",
+            "topic": "Deployment target",
+            "chosen_option": "Fly.io",
+            "referenced_warning_id": "warn-002",
+        },
+    ),
+    (
+        DecisionEntry,
+        {
+            "decision_id": "dec-005",
+            "event_id": "evt-024",
+            "participant_id": "p-005",
+            "topic": "Test framework",
+            "chosen_option": "pytest",
+        },
+    ),
+    (
+        CommentEntry,
+        {
+            "comment_id": "cmt-004",
+            "event_id": "evt-033",
+            "participant_id": "p-004",
+            "content": "Replying to the thread.",
+            "reply_to": "cmt-001",
+        },
+    ),
+    (
+        CommentEntry,
+        {
+            "comment_id": "cmt-005",
+            "event_id": "evt-034",
+            "participant_id": "p-005",
+            "content": "Top-level comment.",
+        },
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("cls", "kwargs"),
+    _ROUND_TRIP_CASES,
+    ids=[
+        "anomaly",
+        "warning",
+        "decision",
+        "decision-without-warning-ref",
+        "comment",
+        "comment-without-reply",
+    ],
+)
+def test_round_trip(cls: type[BaseModel], kwargs: dict[str, Any]) -> None:
+    original = cls(**kwargs)
+    assert cls.model_validate(original.model_dump()) == original
 
-    def test_valid_construction_with_warning_ref(self) -> None:
-        decision = DecisionEntry(
-            decision_id="dec-001",
-            event_id="evt-020",
-            participant_id="p-001",
-            topic="Step ordering",
-            chosen_option="sequential",
-            referenced_warning_id="warn-001",
-        )
-        assert decision.decision_id == "dec-001"
-        assert decision.event_id == "evt-020"
-        assert decision.participant_id == "p-001"
-        assert decision.topic == "Step ordering"
-        assert decision.chosen_option == "sequential"
-        assert decision.referenced_warning_id == "warn-001"
-
-    def test_valid_construction_without_warning_ref(self) -> None:
-        decision = DecisionEntry(
-            decision_id="dec-002",
-            event_id="evt-021",
-            participant_id="p-002",
-            topic="Architecture pattern",
-            chosen_option="event-sourced",
-        )
-        assert decision.referenced_warning_id is None
-
-    def test_frozen_rejects_assignment(self) -> None:
-        decision = DecisionEntry(
-            decision_id="dec-003",
-            event_id="evt-022",
-            participant_id="p-003",
-            topic="Language choice",
-            chosen_option="Python",
-        )
-        with pytest.raises(PydanticValidationError):
-            decision.topic = "changed"  # type: ignore[misc]
-
-    def test_round_trip_via_model_dump_validate(self) -> None:
-        original = DecisionEntry(
-            decision_id="dec-004",
-            event_id="evt-023",
-            participant_id="p-004",
-            topic="Deployment target",
-            chosen_option="Fly.io",
-            referenced_warning_id="warn-002",
-        )
-        data = original.model_dump()
-        restored = DecisionEntry.model_validate(data)
-        assert restored == original
-
-    def test_round_trip_without_warning_ref(self) -> None:
-        original = DecisionEntry(
-            decision_id="dec-005",
-            event_id="evt-024",
-            participant_id="p-005",
-            topic="Test framework",
-            chosen_option="pytest",
-        )
-        data = original.model_dump()
-        restored = DecisionEntry.model_validate(data)
-        assert restored == original
-        assert restored.referenced_warning_id is None
 
+# ── Immutability ───────────────────────────────────────────────────────────
 
-# ── CommentEntry ───────────────────────────────────────────────────────────
 
+_FROZEN_CASES: list[tuple[type[BaseModel], dict[str, Any], str]] = [
+    (CollaborationAnomaly, _ANOMALY_KW, "event_id"),
+    (WarningEntry, _WARNING_KW, "warning_id"),
+    (DecisionEntry, _DECISION_KW, "topic"),
+    (CommentEntry, _COMMENT_KW, "content"),
+    (ReducedCollaborationState, {"mission_id": "mission-frozen"}, "mission_id"),
+]
 
-class TestCommentEntry:
-    """Tests for the CommentEntry model."""
 
-    def test_valid_construction_with_reply(self) -> None:
-        comment = CommentEntry(
-            comment_id="cmt-001",
-            event_id="evt-030",
-            participant_id="p-001",
-            content="Looks good to me.",
-            reply_to="cmt-000",
-        )
-        assert comment.comment_id == "cmt-001"
-        assert comment.event_id == "evt-030"
-        assert comment.participant_id == "p-001"
-        assert comment.content == "Looks good to me."
-        assert comment.reply_to == "cmt-000"
-
-    def test_valid_construction_without_reply(self) -> None:
-        comment = CommentEntry(
-            comment_id="cmt-002",
-            event_id="evt-031",
-            participant_id="p-002",
-            content="Starting implementation now.",
-        )
-        assert comment.reply_to is None
-
-    def test_frozen_rejects_assignment(self) -> None:
-        comment = CommentEntry(
-            comment_id="cmt-003",
-            event_id="evt-032",
-            participant_id="p-003",
-            content="Original content.",
-        )
-        with pytest.raises(PydanticValidationError):
-            comment.content = "modified"  # type: ignore[misc]
-
-    def test_round_trip_via_model_dump_validate(self) -> None:
-        original = CommentEntry(
-            comment_id="cmt-004",
-            event_id="evt-033",
-            participant_id="p-004",
-            content="Replying to the thread.",
-            reply_to="cmt-001",
-        )
-        data = original.model_dump()
-        restored = CommentEntry.model_validate(data)
-        assert restored == original
-
-    def test_round_trip_without_reply(self) -> None:
-        original = CommentEntry(
-            comment_id="cmt-005",
-            event_id="evt-034",
-            participant_id="p-005",
-            content="Top-level comment.",
-        )
-        data = original.model_dump()
-        restored = CommentEntry.model_validate(data)
-        assert restored == original
-        assert restored.reply_to is None
+@pytest.mark.parametrize(
+    ("cls", "kwargs", "attr"),
+    _FROZEN_CASES,
+    ids=[cls.__name__ for cls, _, _ in _FROZEN_CASES],
+)
+def test_frozen_rejects_assignment(
+    cls: type[BaseModel], kwargs: dict[str, Any], attr: str
+) -> None:
+    inst = cls(**kwargs)
+    with pytest.raises(PydanticValidationError):
+        setattr(inst, attr, "changed")
 
 
 # ── ReducedCollaborationState ──────────────────────────────────────────────
@@ -288,73 +430,10 @@ class TestCommentEntry:
 class TestReducedCollaborationState:
     """Tests for the ReducedCollaborationState model."""
 
-    def _make_populated_state(self) -> ReducedCollaborationState:
-        """Build a representative populated state for reuse across tests."""
-        p1 = ParticipantIdentity(
-            participant_id="p-001",
-            participant_type="human",
-            display_name="Alice",
-        )
-        p2 = ParticipantIdentity(
-            participant_id="p-002",
-            participant_type="llm_context",
-            display_name="Claude",
-        )
-        departed = ParticipantIdentity(
-            participant_id="p-003",
-            participant_type="human",
-            display_name="Bob",
-        )
-        now = datetime(2025, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
-        focus_wp03 = FocusTarget(target_type="wp", target_id="WP03")
-
-        warning = WarningEntry(
-            warning_id="warn-001",
-            event_id="evt-100",
-            warning_type="ConcurrentDriverWarning",
-            participant_ids=("p-001", "p-002"),
-            acknowledgements={"p-001": "proceed"},
-        )
-        decision = DecisionEntry(
-            decision_id="dec-001",
-            event_id="evt-101",
-            participant_id="p-001",
-            topic="Step ordering",
-            chosen_option="sequential",
-            referenced_warning_id="warn-001",
-        )
-        comment = CommentEntry(
-            comment_id="cmt-001",
-            event_id="evt-102",
-            participant_id="p-002",
-            content="Acknowledged.",
-        )
-        anomaly = CollaborationAnomaly(
-            event_id="evt-103",
-            event_type="PresenceHeartbeat",
-            reason="Heartbeat from departed participant p-003",
-        )
-
-        return ReducedCollaborationState(
-            mission_id="mission-abc",
-            participants={"p-001": p1, "p-002": p2},
-            departed_participants={"p-003": departed},
-            presence={"p-001": now, "p-002": now},
-            active_drivers=frozenset({"p-001"}),
-            focus_by_participant={"p-001": focus_wp03},
-            participants_by_focus={"wp:WP03": frozenset({"p-001"})},
-            warnings=(warning,),
-            decisions=(decision,),
-            comments=(comment,),
-            active_executions={"p-001": ["step-1", "step-2"]},
-            linked_sessions={"p-002": ["sess-xyz"]},
-            anomalies=(anomaly,),
-            event_count=15,
-            last_processed_event_id="evt-103",
-        )
-
-    def test_populated_construction(self) -> None:
-        state = self._make_populated_state()
+    def test_populated_construction(
+        self, populated_state: ReducedCollaborationState
+    ) -> None:
+        state = populated_state
         assert state.mission_id == "mission-abc"
         assert len(state.participants) == 2
         assert "p-001" in state.participants
@@ -363,12 +442,12 @@ class TestReducedCollaborationState:
         assert len(state.departed_participants) == 1
         assert "p-003" in state.departed_participants
         assert len(state.presence) == 2
-        assert state.active_drivers == frozenset({"p-001"})
+        assert state.active_drivers == _FS_P001
         assert "p-001" in state.focus_by_participant
         assert state.focus_by_participant["p-001"].target_type == "wp"
         assert state.focus_by_participant["p-001"].target_id == "WP03"
         assert "wp:WP03" in state.participants_by_focus
-        assert state.participants_by_focus["wp:WP03"] == frozenset({"p-001"})
+        assert state.participants_by_focus["wp:WP03"] == _FS_P001
         assert len(state.warnings) == 1
         assert len(state.decisions) == 1
         assert len(state.comments) == 1
@@ -378,8 +457,10 @@ class TestReducedCollaborationState:
         assert state.event_count == 15
         assert state.last_processed_event_id == "evt-103"
 
-    def test_default_factory_values(self) -> None:
-        state = ReducedCollaborationState(mission_id="mission-empty")
+    def test_default_factory_values(
+        self, empty_state: ReducedCollaborationState
+    ) -> None:
+        state = empty_state
         assert state.mission_id == "mission-empty"
         assert state.participants == {}
         assert state.departed_participants == {}
@@ -396,15 +477,13 @@ class TestReducedCollaborationState:
         assert state.event_count == 0
         assert state.last_processed_event_id is None
 
-    def test_frozen_rejects_assignment(self) -> None:
-        state = ReducedCollaborationState(mission_id="mission-frozen")
-        with pytest.raises(PydanticValidationError):
-            state.mission_id = "changed"  # type: ignore[misc]
-
-    def test_round_trip_via_model_dump_validate(self) -> None:
-        original = self._make_populated_state()
-        data = original.model_dump()
-        restored = ReducedCollaborationState.model_validate(data)
+    def test_round_trip_via_model_dump_validate(
+        self,
+        populated_state: ReducedCollaborationState,
+        dumped_state: dict[str, Any],
+    ) -> None:
+        original = populated_state
+        restored = ReducedCollaborationState.model_validate(dumped_state)
         assert restored.mission_id == original.mission_id
         assert restored.event_count == original.event_count
         assert restored.last_processed_event_id == original.last_processed_event_id
@@ -419,24 +498,14 @@ class TestReducedCollaborationState:
     def test_participants_by_focus_with_string_keys(self) -> None:
         state = ReducedCollaborationState(
             mission_id="mission-focus",
-            participants_by_focus={
-                "wp:WP03": frozenset({"p-001"}),
-                "step:step-5": frozenset({"p-002", "p-003"}),
-                "file:src/main.py": frozenset({"p-004"}),
-            },
-        )
-        assert state.participants_by_focus["wp:WP03"] == frozenset({"p-001"})
-        assert state.participants_by_focus["step:step-5"] == frozenset(
-            {"p-002", "p-003"}
-        )
-        assert state.participants_by_focus["file:src/main.py"] == frozenset(
-            {"p-004"}
+            participants_by_focus=_EXPECTED_FOCUS,
         )
+        assert state.participants_by_focus == _EXPECTED_FOCUS
 
     def test_active_drivers_is_frozenset(self) -> None:
         state = ReducedCollaborationState(
             mission_id="mission-drivers",
-            active_drivers=frozenset({"p-001", "p-002"}),
+            active_drivers=_FS_P001_P002,
         )
         assert isinstance(state.active_drivers, frozenset)
         assert len(state.active_drivers) == 2
@@ -461,13 +530,23 @@ class TestReducedCollaborationState:
         assert state.warnings[0].warning_id == "warn-A"
         assert state.warnings[1].warning_id == "warn-B"
 
-    def test_model_dump_produces_dict(self) -> None:
-        state = ReducedCollaborationState(mission_id="mission-dump")
-        dumped = state.model_dump()
-        assert isinstance(dumped, dict)
-        assert dumped["mission_id"] == "mission-dump"
-        assert dumped["event_count"] == 0
-        assert dumped["participants"] == {}
+    def test_model_dump_produces_dict(self, dumped_state: dict[str, Any]) -> None:
+        dumped = dumped_state
+        assert type(dumped) is dict
+        assert dumped["mission_id"] == "mission-abc"
+        assert dumped["event_count"] == 15
+        assert set(dumped["participants"]) == {"p-001", "p-002"}
+
+    def test_anomaly_count(
+        self,
+        populated_state: ReducedCollaborationState,
+        empty_state: ReducedCollaborationState,
+        dumped_state: dict[str, Any],
+    ) -> None:
+        assert populated_state.anomaly_count == 1
+        assert empty_state.anomaly_count == 0
+        # Derived, not a field: dumps and schemas do not carry it.
+        assert "anomaly_count" not in dumped_state
 
     def test_mission_id_is_required(self) -> None:
         with pytest.raises(PydanticValidationError):
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 import pytest
+from pydantic import BaseModel, TypeAdapter
 from pydantic import ValidationError as PydanticValidationError
 
 from spec_kitty_events.collaboration import (
@@ -31,61 +34,128 @@ def _make_identity(
     )
 
 
+_PAYLOAD_CLASSES: tuple[type[BaseModel], ...] = (
+    ParticipantInvitedPayload,
+    ParticipantJoinedPayload,
+    ParticipantLeftPayload,
+    PresenceHeartbeatPayload,
+)
+# Adapters are built once at import and reused by every validate call.
+_ADAPTERS: dict[type[BaseModel], TypeAdapter[Any]] = {
+    cls: TypeAdapter(cls) for cls in _PAYLOAD_CLASSES
+}
+
+
+# Validated once at import; shared by every kwargs dict that needs an identity.
+_DEFAULT_IDENTITY = _make_identity()
+
+# Valid keyword arguments per model; rejection tests blank one entry.
+_INVITED_KW: dict[str, Any] = {
+    "participant_id": "p-001",
+    "participant_identity": _DEFAULT_IDENTITY,
+    "invited_by": "p-host",
+    "mission_id": "m-100",
+}
+_JOINED_KW: dict[str, Any] = {
+    "participant_id": "p-001",
+    "participant_identity": _DEFAULT_IDENTITY,
+    "mission_id": "m-100",
+}
+_LEFT_KW: dict[str, Any] = {"participant_id": "p-001", "mission_id": "m-100"}
+_HEARTBEAT_KW: dict[str, Any] = {"participant_id": "p-001", "mission_id": "m-100"}
+
+# Expected ``model_dump`` of each shared sample below.
+_IDENTITY_EXPECTED: dict[str, Any] = {
+    "participant_id": "p-001",
+    "participant_type": "human",
+    "display_name": "Alice",
+    "session_id": "sess-abc",
+    "external_refs": None,
+}
+_INVITED_EXPECTED: dict[str, Any] = {
+    "participant_id": "p-001",
+    "participant_identity": _IDENTITY_EXPECTED,
+    "invited_by": "p-host",
+    "mission_id": "m-100",
+}
+_JOINED_EXPECTED: dict[str, Any] = {
+    "participant_id": "p-001",
+    "participant_identity": _IDENTITY_EXPECTED,
+    "mission_id": "m-100",
+    "auth_principal_id": "auth-abc",
+}
+_LEFT_EXPECTED: dict[str, Any] = {
+    "participant_id": "p-001",
+    "mission_id": "m-100",
+    "reason": "disconnect",
+}
+_HEARTBEAT_EXPECTED: dict[str, Any] = {
+    "participant_id": "p-001",
+    "mission_id": "m-100",
+    "session_id": "sess-abc",
+}
+
+
+# ── Shared instances (read-only tests; never mutated) ───────────────────────
+
+
+@pytest.fixture(scope="module")
+def invited_payload() -> ParticipantInvitedPayload:
+    return ParticipantInvitedPayload(**_INVITED_KW)
+
+
+@pytest.fixture(scope="module")
+def joined_payload() -> ParticipantJoinedPayload:
+    return ParticipantJoinedPayload(**_JOINED_KW, auth_principal_id="auth-abc")
+
+
+@pytest.fixture(scope="module")
+def left_payload() -> ParticipantLeftPayload:
+    return ParticipantLeftPayload(**_LEFT_KW, reason="disconnect")
+
+
+@pytest.fixture(scope="module")
+def heartbeat_payload() -> PresenceHeartbeatPayload:
+    return PresenceHeartbeatPayload(**_HEARTBEAT_KW, session_id="sess-abc")
+
+
+@pytest.fixture(scope="module")
+def invited_dumped(invited_payload: ParticipantInvitedPayload) -> dict[str, Any]:
+    """One ``model_dump`` of the shared sample; tests must not mutate it."""
+    return invited_payload.model_dump()
+
+
+@pytest.fixture(scope="module")
+def joined_dumped(joined_payload: ParticipantJoinedPayload) -> dict[str, Any]:
+    """One ``model_dump`` of the shared sample; tests must not mutate it."""
+    return joined_payload.model_dump()
+
+
+@pytest.fixture(scope="module")
+def left_dumped(left_payload: ParticipantLeftPayload) -> dict[str, Any]:
+    """One ``model_dump`` of the shared sample; tests must not mutate it."""
+    return left_payload.model_dump()
+
+
+@pytest.fixture(scope="module")
+def heartbeat_dumped(heartbeat_payload: PresenceHeartbeatPayload) -> dict[str, Any]:
+    """One ``model_dump`` of the shared sample; tests must not mutate it."""
+    return heartbeat_payload.model_dump()
+
+
 # ── ParticipantInvitedPayload ──────────────────────────────────────────────
 
 
 class TestParticipantInvitedPayload:
     """Tests for the ParticipantInvitedPayload model."""
 
-    def test_valid_construction(self) -> None:
-        identity = _make_identity()
-        payload = ParticipantInvitedPayload(
-            participant_id="p-001",
-            participant_identity=identity,
-            invited_by="p-host",
-            mission_id="m-100",
-        )
-        assert payload.participant_id == "p-001"
-        assert payload.participant_identity == identity
-        assert payload.invited_by == "p-host"
-        assert payload.mission_id == "m-100"
-
-    def test_frozen_rejects_assignment(self) -> None:
-        payload = ParticipantInvitedPayload(
-            participant_id="p-001",
-            participant_identity=_make_identity(),
-            invited_by="p-host",
-            mission_id="m-100",
-        )
-        with pytest.raises(PydanticValidationError):
-            payload.participant_id = "changed"  # type: ignore[misc]
-
-    def test_empty_participant_id_rejected(self) -> None:
-        with pytest.raises(PydanticValidationError):
-            ParticipantInvitedPayload(
-                participant_id="",
-                participant_identity=_make_identity(),
-                invited_by="p-host",
-                mission_id="m-100",
-            )
+    def test_valid_construction(self, invited_dumped: dict[str, Any]) -> None:
+        assert invited_dumped == _INVITED_EXPECTED
 
-    def test_empty_invited_by_rejected(self) -> None:
+    @pytest.mark.parametrize("field", ["participant_id", "invited_by", "mission_id"])
+    def test_empty_field_rejected(self, field: str) -> None:
         with pytest.raises(PydanticValidationError):
-            ParticipantInvitedPayload(
-                participant_id="p-001",
-                participant_identity=_make_identity(),
-                invited_by="",
-                mission_id="m-100",
-            )
-
-    def test_empty_mission_id_rejected(self) -> None:
-        with pytest.raises(PydanticValidationError):
-            ParticipantInvitedPayload(
-                participant_id="p-001",
-                participant_identity=_make_identity(),
-                invited_by="p-host",
-                mission_id="",
-            )
+            ParticipantInvitedPayload(**{**_INVITED_KW, field: ""})
 
     def test_embedded_participant_identity(self) -> None:
         identity = _make_identity(
@@ -105,30 +175,11 @@ class TestParticipantInvitedPayload:
         assert payload.participant_identity.display_name == "Claude"
         assert payload.participant_identity.session_id == "sess-xyz"
 
-    def test_round_trip_via_model_dump_validate(self) -> None:
-        original = ParticipantInvitedPayload(
-            participant_id="p-003",
-            participant_identity=_make_identity(participant_id="p-003"),
-            invited_by="p-host",
-            mission_id="m-300",
-        )
-        data = original.model_dump()
-        restored = ParticipantInvitedPayload.model_validate(data)
-        assert restored == original
-
-    def test_model_dump_produces_dict(self) -> None:
-        payload = ParticipantInvitedPayload(
-            participant_id="p-004",
-            participant_identity=_make_identity(participant_id="p-004"),
-            invited_by="p-host",
-            mission_id="m-400",
-        )
-        dumped = payload.model_dump()
-        assert isinstance(dumped, dict)
-        assert dumped["participant_id"] == "p-004"
-        assert dumped["invited_by"] == "p-host"
-        assert dumped["mission_id"] == "m-400"
-        assert isinstance(dumped["participant_identity"], dict)
+    def test_round_trip_via_model_dump_validate(
+        self, invited_payload: ParticipantInvitedPayload, invited_dumped: dict[str, Any]
+    ) -> None:
+        restored = _ADAPTERS[ParticipantInvitedPayload].validate_python(invited_dumped)
+        assert restored == invited_payload
 
     def test_missing_required_fields_rejected(self) -> None:
         with pytest.raises(PydanticValidationError):
@@ -143,56 +194,28 @@ class TestParticipantInvitedPayload:
 class TestParticipantJoinedPayload:
     """Tests for the ParticipantJoinedPayload model."""
 
-    def test_valid_construction_with_auth(self) -> None:
-        identity = _make_identity()
-        payload = ParticipantJoinedPayload(
-            participant_id="p-001",
-            participant_identity=identity,
-            mission_id="m-100",
-            auth_principal_id="auth-abc",
-        )
-        assert payload.participant_id == "p-001"
-        assert payload.participant_identity == identity
-        assert payload.mission_id == "m-100"
-        assert payload.auth_principal_id == "auth-abc"
+    def test_valid_construction_with_auth(
+        self, joined_dumped: dict[str, Any]
+    ) -> None:
+        assert joined_dumped == _JOINED_EXPECTED
 
     def test_valid_construction_without_auth(self) -> None:
         payload = ParticipantJoinedPayload(
             participant_id="p-001",
-            participant_identity=_make_identity(),
+            participant_identity=_DEFAULT_IDENTITY,
             mission_id="m-100",
         )
         assert payload.auth_principal_id is None
 
-    def test_frozen_rejects_assignment(self) -> None:
-        payload = ParticipantJoinedPayload(
-            participant_id="p-001",
-            participant_identity=_make_identity(),
-            mission_id="m-100",
-        )
+    @pytest.mark.parametrize("field", ["participant_id", "mission_id"])
+    def test_empty_field_rejected(self, field: str) -> None:
         with pytest.raises(PydanticValidationError):
-            payload.mission_id = "changed"  # type: ignore[misc]
-
-    def test_empty_participant_id_rejected(self) -> None:
-        with pytest.raises(PydanticValidationError):
-            ParticipantJoinedPayload(
-                participant_id="",
-                participant_identity=_make_identity(),
-                mission_id="m-100",
-            )
-
-    def test_empty_mission_id_rejected(self) -> None:
-        with pytest.raises(PydanticValidationError):
-            ParticipantJoinedPayload(
-                participant_id="p-001",
-                participant_identity=_make_identity(),
-                mission_id="",
-            )
+            ParticipantJoinedPayload(**{**_JOINED_KW, field: ""})
 
     def test_auth_principal_id_defaults_to_none(self) -> None:
         payload = ParticipantJoinedPayload(
             participant_id="p-002",
-            participant_identity=_make_identity(participant_id="p-002"),
+            participant_identity=_DEFAULT_IDENTITY,
             mission_id="m-200",
         )
         assert payload.auth_principal_id is None
@@ -211,36 +234,26 @@ class TestParticipantJoinedPayload:
         assert payload.participant_identity.participant_type == "llm_context"
         assert payload.participant_identity.display_name == "GPT"
 
-    def test_round_trip_via_model_dump_validate(self) -> None:
-        original = ParticipantJoinedPayload(
-            participant_id="p-003",
-            participant_identity=_make_identity(participant_id="p-003"),
-            mission_id="m-300",
-            auth_principal_id="auth-xyz",
-        )
-        data = original.model_dump()
-        restored = ParticipantJoinedPayload.model_validate(data)
-        assert restored == original
+    def test_round_trip_via_model_dump_validate(
+        self, joined_payload: ParticipantJoinedPayload, joined_dumped: dict[str, Any]
+    ) -> None:
+        restored = _ADAPTERS[ParticipantJoinedPayload].validate_python(joined_dumped)
+        assert restored == joined_payload
 
     def test_round_trip_without_auth(self) -> None:
-        original = ParticipantJoinedPayload(
-            participant_id="p-004",
-            participant_identity=_make_identity(participant_id="p-004"),
-            mission_id="m-400",
-        )
-        data = original.model_dump()
-        restored = ParticipantJoinedPayload.model_validate(data)
+        original = ParticipantJoinedPayload(**_JOINED_KW)
+        dumped = original.model_dump()
+        restored = _ADAPTERS[ParticipantJoinedPayload].validate_python(dumped)
         assert restored == original
         assert restored.auth_principal_id is None
 
     def test_model_dump_produces_dict(self) -> None:
         payload = ParticipantJoinedPayload(
             participant_id="p-005",
-            participant_identity=_make_identity(participant_id="p-005"),
+            participant_identity=_DEFAULT_IDENTITY,
             mission_id="m-500",
         )
         dumped = payload.model_dump()
-        assert isinstance(dumped, dict)
         assert dumped["participant_id"] == "p-005"
         assert dumped["auth_principal_id"] is None
 
@@ -251,15 +264,10 @@ class TestParticipantJoinedPayload:
 class TestParticipantLeftPayload:
     """Tests for the ParticipantLeftPayload model."""
 
-    def test_valid_construction_with_reason(self) -> None:
-        payload = ParticipantLeftPayload(
-            participant_id="p-001",
-            mission_id="m-100",
-            reason="disconnect",
-        )
-        assert payload.participant_id == "p-001"
-        assert payload.mission_id == "m-100"
-        assert payload.reason == "disconnect"
+    def test_valid_construction_with_reason(
+        self, left_dumped: dict[str, Any]
+    ) -> None:
+        assert left_dumped == _LEFT_EXPECTED
 
     def test_valid_construction_without_reason(self) -> None:
         payload = ParticipantLeftPayload(
@@ -268,27 +276,10 @@ class TestParticipantLeftPayload:
         )
         assert payload.reason is None
 
-    def test_frozen_rejects_assignment(self) -> None:
-        payload = ParticipantLeftPayload(
-            participant_id="p-001",
-            mission_id="m-100",
-        )
-        with pytest.raises(PydanticValidationError):
-            payload.participant_id = "changed"  # type: ignore[misc]
-
-    def test_empty_participant_id_rejected(self) -> None:
+    @pytest.mark.parametrize("field", ["participant_id", "mission_id"])
+    def test_empty_field_rejected(self, field: str) -> None:
         with pytest.raises(PydanticValidationError):
-            ParticipantLeftPayload(
-                participant_id="",
-                mission_id="m-100",
-            )
-
-    def test_empty_mission_id_rejected(self) -> None:
-        with pytest.raises(PydanticValidationError):
-            ParticipantLeftPayload(
-                participant_id="p-001",
-                mission_id="",
-            )
+            ParticipantLeftPayload(**{**_LEFT_KW, field: ""})
 
     def test_reason_defaults_to_none(self) -> None:
         payload = ParticipantLeftPayload(
@@ -305,38 +296,19 @@ class TestParticipantLeftPayload:
         )
         assert payload.reason == "explicit"
 
-    def test_round_trip_via_model_dump_validate(self) -> None:
-        original = ParticipantLeftPayload(
-            participant_id="p-004",
-            mission_id="m-400",
-            reason="timeout",
-        )
-        data = original.model_dump()
-        restored = ParticipantLeftPayload.model_validate(data)
-        assert restored == original
+    def test_round_trip_via_model_dump_validate(
+        self, left_payload: ParticipantLeftPayload, left_dumped: dict[str, Any]
+    ) -> None:
+        restored = _ADAPTERS[ParticipantLeftPayload].validate_python(left_dumped)
+        assert restored == left_payload
 
     def test_round_trip_without_reason(self) -> None:
-        original = ParticipantLeftPayload(
-            participant_id="p-005",
-            mission_id="m-500",
-        )
-        data = original.model_dump()
-        restored = ParticipantLeftPayload.model_validate(data)
+        original = ParticipantLeftPayload(**_LEFT_KW)
+        dumped = original.model_dump()
+        restored = _ADAPTERS[ParticipantLeftPayload].validate_python(dumped)
         assert restored == original
         assert restored.reason is None
 
-    def test_model_dump_produces_dict(self) -> None:
-        payload = ParticipantLeftPayload(
-            participant_id="p-006",
-            mission_id="m-600",
-            reason="disconnect",
-        )
-        dumped = payload.model_dump()
-        assert isinstance(dumped, dict)
-        assert dumped["participant_id"] == "p-006"
-        assert dumped["mission_id"] == "m-600"
-        assert dumped["reason"] == "disconnect"
-
 
 # ── PresenceHeartbeatPayload ──────────────────────────────────────────────
 
@@ -344,15 +316,10 @@ class TestParticipantLeftPayload:
 class TestPresenceHeartbeatPayload:
     """Tests for the PresenceHeartbeatPayload model."""
 
-    def test_valid_construction_with_session(self) -> None:
-        payload = PresenceHeartbeatPayload(
-            participant_id="p-001",
-            mission_id="m-100",
-            session_id="sess-abc",
-        )
-        assert payload.participant_id == "p-001"
-        assert payload.mission_id == "m-100"
-        assert payload.session_id == "sess-abc"
+    def test_valid_construction_with_session(
+        self, heartbeat_dumped: dict[str, Any]
+    ) -> None:
+        assert heartbeat_dumped == _HEARTBEAT_EXPECTED
 
     def test_valid_construction_without_session(self) -> None:
         payload = PresenceHeartbeatPayload(
@@ -361,27 +328,10 @@ class TestPresenceHeartbeatPayload:
         )
         assert payload.session_id is None
 
-    def test_frozen_rejects_assignment(self) -> None:
-        payload = PresenceHeartbeatPayload(
-            participant_id="p-001",
-            mission_id="m-100",
-        )
-        with pytest.raises(PydanticValidationError):
-            payload.participant_id = "changed"  # type: ignore[misc]
-
-    def test_empty_participant_id_rejected(self) -> None:
+    @pytest.mark.parametrize("field", ["participant_id", "mission_id"])
+    def test_empty_field_rejected(self, field: str) -> None:
         with pytest.raises(PydanticValidationError):
-            PresenceHeartbeatPayload(
-                participant_id="",
-                mission_id="m-100",
-            )
-
-    def test_empty_mission_id_rejected(self) -> None:
-        with pytest.raises(PydanticValidationError):
-            PresenceHeartbeatPayload(
-                participant_id="p-001",
-                mission_id="",
-            )
+            PresenceHeartbeatPayload(**{**_HEARTBEAT_KW, field: ""})
 
     def test_session_id_defaults_to_none(self) -> None:
         payload = PresenceHeartbeatPayload(
@@ -398,34 +348,38 @@ class TestPresenceHeartbeatPayload:
         )
         assert payload.session_id == "sess-xyz"
 
-    def test_round_trip_via_model_dump_validate(self) -> None:
-        original = PresenceHeartbeatPayload(
-            participant_id="p-004",
-            mission_id="m-400",
-            session_id="sess-123",
-        )
-        data = original.model_dump()
-        restored = PresenceHeartbeatPayload.model_validate(data)
-        assert restored == original
+    def test_round_trip_via_model_dump_validate(
+        self,
+        heartbeat_payload: PresenceHeartbeatPayload,
+        heartbeat_dumped: dict[str, Any],
+    ) -> None:
+        restored = _ADAPTERS[PresenceHeartbeatPayload].validate_python(heartbeat_dumped)
+        assert restored == heartbeat_payload
 
     def test_round_trip_without_session(self) -> None:
-        original = PresenceHeartbeatPayload(
-            participant_id="p-005",
-            mission_id="m-500",
-        )
-        data = original.model_dump()
-        restored = PresenceHeartbeatPayload.model_validate(data)
+        original = PresenceHeartbeatPayload(**_HEARTBEAT_KW)
+        dumped = original.model_dump()
+        restored = _ADAPTERS[PresenceHeartbeatPayload].validate_python(dumped)
         assert restored == original
         assert restored.session_id is None
 
-    def test_model_dump_produces_dict(self) -> None:
-        payload = PresenceHeartbeatPayload(
-            participant_id="p-006",
-            mission_id="m-600",
-            session_id="sess-final",
-        )
-        dumped = payload.model_dump()
-        assert isinstance(dumped, dict)
-        assert dumped["participant_id"] == "p-006"
-        assert dumped["mission_id"] == "m-600"
-        assert dumped["session_id"] == "sess-final"
+
+# ── Immutability ───────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    ("sample", "field"),
+    [
+        ("invited_payload", "participant_id"),
+        ("joined_payload", "mission_id"),
+        ("left_payload", "participant_id"),
+        ("heartbeat_payload", "participant_id"),
+    ],
+)
+def test_frozen_rejects_assignment(
+    request: pytest.FixtureRequest, sample: str, field: str
+) -> None:
+    # Assignment fails before mutating, so the shared sample stays intact.
+    payload = request.getfixturevalue(sample)
+    with pytest.raises(PydanticValidationError):
+        setattr(payload, field, "changed")
@@ -1,10 +1,13 @@
 """Unit tests for the collaboration reducer (WP06)."""
 
+import functools
+import itertools
 import uuid
 from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, Literal, Mapping
 
 import pytest
-from ulid import ULID
 
 from spec_kitty_events.collaboration import (
     COLLABORATION_EVENT_TYPES,
@@ -35,7 +38,28 @@ from spec_kitty_events.collaboration import (
 from spec_kitty_events.models import Event, SpecKittyEventsError
 
 _PROJECT_UUID = uuid.UUID("12345678-1234-5678-1234-567812345678")
-_CORRELATION_ID = str(ULID())
+# Fixed, canonical (uppercase Crockford base32) 26-char correlation id.
+_CORRELATION_ID = "01J0000000000000000000C0RR"
+
+# Seeded roster shared by tests that skip the ParticipantJoined event.
+_SEED_IDENTITY_P1 = ParticipantIdentity(
+    participant_id="p1",
+    participant_type="human",
+    display_name="Agent p1",
+)
+_SEED_ROSTER_P1: Mapping[str, ParticipantIdentity] = MappingProxyType(
+    {"p1": _SEED_IDENTITY_P1}
+)
+
+# Deterministic defaults for _make_event: a fixed timestamp and monotonically
+# increasing 26-char ULID-shaped ids, so events built in order sort in order
+# without a clock read or random bytes per event.
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_id_counter = itertools.count()
+
+
+def _next_id() -> str:
+    return f"01J{next(_id_counter):023d}"
 
 
 def _make_event(
@@ -45,13 +69,17 @@ def _make_event(
     event_id: str | None = None,
     timestamp: datetime | None = None,
 ) -> Event:
-    """Helper to build a collaboration event with sensible defaults."""
-    return Event(
-        event_id=event_id or str(ULID()),
+    """Helper to build a collaboration event with sensible defaults.
+
+    Inputs are trusted, so the envelope is built without validation;
+    ``test_make_event_matches_validated_event`` keeps the two paths in sync.
+    """
+    return Event.model_construct(
+        event_id=event_id or _next_id(),
         event_type=event_type,
         aggregate_id="mission/M001",
         payload=payload,
-        timestamp=timestamp or datetime.now(timezone.utc),
+        timestamp=timestamp or _FIXED_TS,
         build_id="test-build",
         node_id="node-1",
         lamport_clock=clock,
@@ -60,13 +88,16 @@ def _make_event(
     )
 
 
-def _identity(pid: str, ptype: str = "human") -> dict:  # type: ignore[type-arg]
-    """Build a participant_identity dict for payloads."""
-    return {
-        "participant_id": pid,
-        "participant_type": ptype,
-        "display_name": f"Agent {pid}",
-    }
+@functools.lru_cache(maxsize=None)
+def _identity(pid: str, ptype: str = "human") -> Mapping[str, Any]:
+    """Build a read-only participant_identity mapping for payloads (cached)."""
+    return MappingProxyType(
+        {
+            "participant_id": pid,
+            "participant_type": ptype,
+            "display_name": f"Agent {pid}",
+        }
+    )
 
 
 def _join_event(pid: str, clock: int = 0) -> Event:
@@ -91,6 +122,105 @@ def _leave_event(pid: str, clock: int = 10) -> Event:
     )
 
 
+# Payload templates for the most common event shapes; helpers merge in the
+# varying fields rather than rebuilding the whole dict literal.
+_PARTICIPANT_TEMPLATE: dict[str, Any] = {"participant_id": "", "mission_id": "M001"}
+_DRIVE_INTENT_TEMPLATE: dict[str, Any] = {
+    "participant_id": "",
+    "mission_id": "M001",
+    "intent": "active",
+}
+_WARNING_ACK_TEMPLATE: dict[str, Any] = {
+    "participant_id": "",
+    "mission_id": "M001",
+    "warning_id": "",
+    "acknowledgement": "continue",
+}
+
+
+def _heartbeat(pid: str, clock: int, event_id: str | None = None) -> Event:
+    """Shortcut: create a PresenceHeartbeat event."""
+    return _make_event(
+        PRESENCE_HEARTBEAT,
+        _PARTICIPANT_TEMPLATE | {"participant_id": pid},
+        clock=clock,
+        event_id=event_id,
+    )
+
+
+def _drive_intent(pid: str, intent: str, clock: int) -> Event:
+    """Shortcut: create a DriveIntentSet event."""
+    return _make_event(
+        DRIVE_INTENT_SET,
+        _DRIVE_INTENT_TEMPLATE | {"participant_id": pid, "intent": intent},
+        clock=clock,
+    )
+
+
+def _focus(pid: str, wp_id: str, clock: int) -> Event:
+    """Shortcut: create a FocusChanged event targeting a work package."""
+    return _make_event(
+        FOCUS_CHANGED,
+        _PARTICIPANT_TEMPLATE
+        | {
+            "participant_id": pid,
+            "focus_target": {"target_type": "wp", "target_id": wp_id},
+        },
+        clock=clock,
+    )
+
+
+def _warning_ack(pid: str, warning_id: str, acknowledgement: str, clock: int) -> Event:
+    """Shortcut: create a WarningAcknowledged event."""
+    return _make_event(
+        WARNING_ACKNOWLEDGED,
+        _WARNING_ACK_TEMPLATE
+        | {
+            "participant_id": pid,
+            "warning_id": warning_id,
+            "acknowledgement": acknowledgement,
+        },
+        clock=clock,
+    )
+
+
+# ── Shared events (module scope; Event is frozen and never mutated) ─────────
+
+
+@pytest.fixture(scope="module")
+def joined_p1() -> Event:
+    return _join_event("p1", clock=0)
+
+
+@pytest.fixture(scope="module")
+def joined_p2() -> Event:
+    return _join_event("p2", clock=0)
+
+
+@pytest.fixture(scope="module")
+def warning_w1() -> Event:
+    """ConcurrentDriverWarning ``w1`` for p1/p2 on WP03 at clock 1."""
+    return _make_event(
+        CONCURRENT_DRIVER_WARNING,
+        {
+            "warning_id": "w1",
+            "mission_id": "M001",
+            "participant_ids": ["p1", "p2"],
+            "focus_target": {"target_type": "wp", "target_id": "WP03"},
+            "severity": "warning",
+        },
+        clock=1,
+    )
+
+
+# ── Test helpers ─────────────────────────────────────────────────────────────
+
+
+def test_make_event_matches_validated_event() -> None:
+    evt = _join_event("p1", clock=3)
+    assert Event.model_validate(evt.model_dump()) == evt
+
+
 # ── Empty / filtering tests ─────────────────────────────────────────────────
 
 
@@ -128,46 +258,42 @@ class TestParticipantLifecycle:
         assert "p1" in result.participants
         assert result.participants["p1"].participant_type == "human"
 
-    def test_leave_moves_to_departed(self) -> None:
-        events = [_join_event("p1", clock=0), _leave_event("p1", clock=1)]
+    def test_leave_moves_to_departed(self, joined_p1: Event) -> None:
+        events = (joined_p1, _leave_event("p1", clock=1))
         result = reduce_collaboration_events(events)
         assert "p1" not in result.participants
         assert "p1" in result.departed_participants
 
-    def test_rejoin_after_leave(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
+    def test_rejoin_after_leave(self, joined_p1: Event) -> None:
+        events = (
+            joined_p1,
             _leave_event("p1", clock=1),
             _join_event("p1", clock=2),
-        ]
+        )
         result = reduce_collaboration_events(events)
         assert "p1" in result.participants
         assert "p1" not in result.departed_participants
 
-    def test_duplicate_join_anomaly(self) -> None:
-        events = [_join_event("p1", clock=0), _join_event("p1", clock=1)]
-        result = reduce_collaboration_events(events, mode="permissive")
-        assert len(result.anomalies) == 1
+    @pytest.mark.parametrize("mode", ["strict", "permissive"])
+    def test_duplicate_join_anomaly(
+        self, joined_p1: Event, mode: Literal["strict", "permissive"]
+    ) -> None:
+        events = (joined_p1, _join_event("p1", clock=1))
+        result = reduce_collaboration_events(events, mode=mode)
+        assert result.anomaly_count == 1
         assert "Duplicate join" in result.anomalies[0].reason
 
-    def test_duplicate_leave_anomaly_strict(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
+    @pytest.mark.parametrize("mode", ["strict", "permissive"])
+    def test_duplicate_leave_anomaly(
+        self, joined_p1: Event, mode: Literal["strict", "permissive"]
+    ) -> None:
+        events = (
+            joined_p1,
             _leave_event("p1", clock=1),
             _leave_event("p1", clock=2),
-        ]
-        result = reduce_collaboration_events(events)
-        assert len(result.anomalies) == 1
-        assert "not in roster" in result.anomalies[0].reason
-
-    def test_duplicate_leave_anomaly_permissive(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
-            _leave_event("p1", clock=1),
-            _leave_event("p1", clock=2),
-        ]
-        result = reduce_collaboration_events(events, mode="permissive")
-        assert len(result.anomalies) == 1
+        )
+        result = reduce_collaboration_events(events, mode=mode)
+        assert result.anomaly_count == 1
         assert "not in roster" in result.anomalies[0].reason
 
     def test_invited_does_not_activate_roster(self) -> None:
@@ -182,10 +308,10 @@ class TestParticipantLifecycle:
         )
         result = reduce_collaboration_events([evt])
         assert "p1" not in result.participants
-        assert len(result.anomalies) == 0
+        assert result.anomaly_count == 0
 
     def test_invited_then_join_has_no_duplicate_join_anomaly(self) -> None:
-        events = [
+        events = (
             _make_event(
                 PARTICIPANT_INVITED,
                 {
@@ -197,10 +323,10 @@ class TestParticipantLifecycle:
                 clock=0,
             ),
             _join_event("p1", clock=1),
-        ]
+        )
         result = reduce_collaboration_events(events, mode="strict")
         assert "p1" in result.participants
-        assert len(result.anomalies) == 0
+        assert result.anomaly_count == 0
 
 
 # ── Strict mode ──────────────────────────────────────────────────────────────
@@ -210,35 +336,20 @@ class TestStrictMode:
     """Strict mode raises UnknownParticipantError for unknown participants."""
 
     def test_unknown_participant_raises(self) -> None:
-        evt = _make_event(
-            PRESENCE_HEARTBEAT,
-            {"participant_id": "unknown", "mission_id": "M001"},
-            clock=1,
-        )
+        evt = _heartbeat("unknown", clock=1)
         with pytest.raises(UnknownParticipantError) as exc_info:
             reduce_collaboration_events([evt], mode="strict")
         assert exc_info.value.participant_id == "unknown"
 
     def test_seeded_roster_no_join_needed(self) -> None:
         """With seeded roster, events work without prior join events."""
-        roster = {
-            "p1": ParticipantIdentity(
-                participant_id="p1",
-                participant_type="human",
-                display_name="Agent p1",
-            )
-        }
-        evt = _make_event(
-            PRESENCE_HEARTBEAT,
-            {"participant_id": "p1", "mission_id": "M001"},
-            clock=1,
-        )
-        result = reduce_collaboration_events([evt], roster=roster)
+        evt = _heartbeat("p1", clock=1)
+        result = reduce_collaboration_events([evt], roster=_SEED_ROSTER_P1)
         assert "p1" in result.participants
         assert "p1" in result.presence
 
     def test_invited_only_is_not_active_roster_in_strict_mode(self) -> None:
-        events = [
+        events = (
             _make_event(
                 PARTICIPANT_INVITED,
                 {
@@ -249,12 +360,8 @@ class TestStrictMode:
                 },
                 clock=0,
             ),
-            _make_event(
-                PRESENCE_HEARTBEAT,
-                {"participant_id": "p1", "mission_id": "M001"},
-                clock=1,
-            ),
-        ]
+            _heartbeat("p1", clock=1),
+        )
         with pytest.raises(UnknownParticipantError):
             reduce_collaboration_events(events, mode="strict")
 
@@ -266,33 +373,21 @@ class TestPermissiveMode:
     """Permissive mode records anomalies instead of raising."""
 
     def test_unknown_participant_anomaly(self) -> None:
-        evt = _make_event(
-            PRESENCE_HEARTBEAT,
-            {"participant_id": "unknown", "mission_id": "M001"},
-            clock=1,
-        )
+        evt = _heartbeat("unknown", clock=1)
         result = reduce_collaboration_events([evt], mode="permissive")
-        assert len(result.anomalies) == 1
+        assert result.anomaly_count == 1
         assert "Unknown participant" in result.anomalies[0].reason
 
-    def test_duplicate_join_anomaly(self) -> None:
-        events = [_join_event("p1", clock=0), _join_event("p1", clock=1)]
-        result = reduce_collaboration_events(events, mode="permissive")
-        assert len(result.anomalies) == 1
-        assert "Duplicate join" in result.anomalies[0].reason
-
-    def test_departed_heartbeat_records_anomaly_and_keeps_timestamp(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
+    def test_departed_heartbeat_records_anomaly_and_keeps_timestamp(
+        self, joined_p1: Event
+    ) -> None:
+        events = (
+            joined_p1,
             _leave_event("p1", clock=1),
-            _make_event(
-                PRESENCE_HEARTBEAT,
-                {"participant_id": "p1", "mission_id": "M001"},
-                clock=2,
-            ),
-        ]
+            _heartbeat("p1", clock=2),
+        )
         result = reduce_collaboration_events(events, mode="permissive")
-        assert len(result.anomalies) == 1
+        assert result.anomaly_count == 1
         assert "has departed" in result.anomalies[0].reason
         assert "p1" in result.presence
 
@@ -303,45 +398,31 @@ class TestPermissiveMode:
 class TestDriveIntent:
     """DriveIntentSet events."""
 
-    def test_active_intent_adds_driver(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
-            _make_event(
-                DRIVE_INTENT_SET,
-                {"participant_id": "p1", "mission_id": "M001", "intent": "active"},
-                clock=1,
-            ),
-        ]
+    def test_active_intent_adds_driver(self, joined_p1: Event) -> None:
+        events = (
+            joined_p1,
+            _drive_intent("p1", "active", clock=1),
+        )
         result = reduce_collaboration_events(events)
         assert "p1" in result.active_drivers
 
-    def test_inactive_intent_removes_driver(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
-            _make_event(
-                DRIVE_INTENT_SET,
-                {"participant_id": "p1", "mission_id": "M001", "intent": "active"},
-                clock=1,
-            ),
-            _make_event(
-                DRIVE_INTENT_SET,
-                {"participant_id": "p1", "mission_id": "M001", "intent": "inactive"},
-                clock=2,
-            ),
-        ]
+    def test_inactive_intent_removes_driver(self, joined_p1: Event) -> None:
+        events = (
+            joined_p1,
+            _drive_intent("p1", "active", clock=1),
+            _drive_intent("p1", "inactive", clock=2),
+        )
         result = reduce_collaboration_events(events)
         assert "p1" not in result.active_drivers
 
-    def test_departed_participant_drive_intent_strict_raises(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
+    def test_departed_participant_drive_intent_strict_raises(
+        self, joined_p1: Event
+    ) -> None:
+        events = (
+            joined_p1,
             _leave_event("p1", clock=1),
-            _make_event(
-                DRIVE_INTENT_SET,
-                {"participant_id": "p1", "mission_id": "M001", "intent": "active"},
-                clock=2,
-            ),
-        ]
+            _drive_intent("p1", "active", clock=2),
+        )
         # Departed participants are hard errors in strict mode.
         with pytest.raises(SpecKittyEventsError):
             reduce_collaboration_events(events, mode="strict")
@@ -353,45 +434,21 @@ class TestDriveIntent:
 class TestFocusChanged:
     """FocusChanged events and reverse index."""
 
-    def test_focus_set(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
-            _make_event(
-                FOCUS_CHANGED,
-                {
-                    "participant_id": "p1",
-                    "mission_id": "M001",
-                    "focus_target": {"target_type": "wp", "target_id": "WP03"},
-                },
-                clock=1,
-            ),
-        ]
+    def test_focus_set(self, joined_p1: Event) -> None:
+        events = (
+            joined_p1,
+            _focus("p1", "WP03", clock=1),
+        )
         result = reduce_collaboration_events(events)
         assert result.focus_by_participant["p1"].target_id == "WP03"
         assert "p1" in result.participants_by_focus["wp:WP03"]
 
-    def test_focus_change_updates_reverse_index(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
-            _make_event(
-                FOCUS_CHANGED,
-                {
-                    "participant_id": "p1",
-                    "mission_id": "M001",
-                    "focus_target": {"target_type": "wp", "target_id": "WP01"},
-                },
-                clock=1,
-            ),
-            _make_event(
-                FOCUS_CHANGED,
-                {
-                    "participant_id": "p1",
-                    "mission_id": "M001",
-                    "focus_target": {"target_type": "wp", "target_id": "WP02"},
-                },
-                clock=2,
-            ),
-        ]
+    def test_focus_change_updates_reverse_index(self, joined_p1: Event) -> None:
+        events = (
+            joined_p1,
+            _focus("p1", "WP01", clock=1),
+            _focus("p1", "WP02", clock=2),
+        )
         result = reduce_collaboration_events(events)
         assert result.focus_by_participant["p1"].target_id == "WP02"
         # WP01 should be removed from reverse index (empty set removed)
@@ -405,32 +462,20 @@ class TestFocusChanged:
 class TestWarnings:
     """Warning creation and acknowledgement."""
 
-    def test_concurrent_driver_warning(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
-            _join_event("p2", clock=0),
-            _make_event(
-                CONCURRENT_DRIVER_WARNING,
-                {
-                    "warning_id": "w1",
-                    "mission_id": "M001",
-                    "participant_ids": ["p1", "p2"],
-                    "focus_target": {"target_type": "wp", "target_id": "WP03"},
-                    "severity": "warning",
-                },
-                clock=1,
-            ),
-        ]
+    def test_concurrent_driver_warning(
+        self, joined_p1: Event, joined_p2: Event, warning_w1: Event
+    ) -> None:
+        events = (joined_p1, joined_p2, warning_w1)
         result = reduce_collaboration_events(events)
         assert len(result.warnings) == 1
         assert result.warnings[0].warning_id == "w1"
         assert result.warnings[0].warning_type == CONCURRENT_DRIVER_WARNING
         assert result.warnings[0].participant_ids == ("p1", "p2")
 
-    def test_step_collision_warning(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
-            _join_event("p2", clock=0),
+    def test_step_collision_warning(self, joined_p1: Event, joined_p2: Event) -> None:
+        events = (
+            joined_p1,
+            joined_p2,
             _make_event(
                 POTENTIAL_STEP_COLLISION_DETECTED,
                 {
@@ -442,92 +487,49 @@ class TestWarnings:
                 },
                 clock=1,
             ),
-        ]
+        )
         result = reduce_collaboration_events(events)
         assert len(result.warnings) == 1
         assert result.warnings[0].warning_type == POTENTIAL_STEP_COLLISION_DETECTED
 
-    def test_warning_acknowledged(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
-            _join_event("p2", clock=0),
-            _make_event(
-                CONCURRENT_DRIVER_WARNING,
-                {
-                    "warning_id": "w1",
-                    "mission_id": "M001",
-                    "participant_ids": ["p1", "p2"],
-                    "focus_target": {"target_type": "wp", "target_id": "WP03"},
-                    "severity": "warning",
-                },
-                clock=1,
-            ),
-            _make_event(
-                WARNING_ACKNOWLEDGED,
-                {
-                    "participant_id": "p1",
-                    "mission_id": "M001",
-                    "warning_id": "w1",
-                    "acknowledgement": "continue",
-                },
-                clock=2,
-            ),
-        ]
+    def test_warning_acknowledged(
+        self, joined_p1: Event, joined_p2: Event, warning_w1: Event
+    ) -> None:
+        events = (
+            joined_p1,
+            joined_p2,
+            warning_w1,
+            _warning_ack("p1", "w1", "continue", clock=2),
+        )
         result = reduce_collaboration_events(events)
         assert result.warnings[0].acknowledgements == {"p1": "continue"}
 
-    def test_ack_nonexistent_warning_strict_raises(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
-            _make_event(
-                WARNING_ACKNOWLEDGED,
-                {
-                    "participant_id": "p1",
-                    "mission_id": "M001",
-                    "warning_id": "nonexistent",
-                    "acknowledgement": "continue",
-                },
-                clock=1,
-            ),
-        ]
-        with pytest.raises(SpecKittyEventsError):
-            reduce_collaboration_events(events, mode="strict")
-
-    def test_ack_nonexistent_warning_permissive_anomaly(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
-            _make_event(
-                WARNING_ACKNOWLEDGED,
-                {
-                    "participant_id": "p1",
-                    "mission_id": "M001",
-                    "warning_id": "nonexistent",
-                    "acknowledgement": "continue",
-                },
-                clock=1,
-            ),
-        ]
-        result = reduce_collaboration_events(events, mode="permissive")
-        assert len(result.anomalies) == 1
+    @pytest.mark.parametrize("mode", ["strict", "permissive"])
+    def test_ack_nonexistent_warning(
+        self, joined_p1: Event, mode: Literal["strict", "permissive"]
+    ) -> None:
+        events = (
+            joined_p1,
+            _warning_ack("p1", "nonexistent", "continue", clock=1),
+        )
+        if mode == "strict":
+            with pytest.raises(SpecKittyEventsError):
+                reduce_collaboration_events(events, mode=mode)
+            return
+        result = reduce_collaboration_events(events, mode=mode)
+        assert result.anomaly_count == 1
         assert "not found" in result.anomalies[0].reason
         assert len(result.warnings) == 1
         assert result.warnings[0].warning_id == "nonexistent"
         assert result.warnings[0].acknowledgements == {"p1": "continue"}
 
-    def test_ack_before_warning_preserves_ack_when_warning_arrives(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
-            _join_event("p2", clock=0),
-            _make_event(
-                WARNING_ACKNOWLEDGED,
-                {
-                    "participant_id": "p1",
-                    "mission_id": "M001",
-                    "warning_id": "w-late",
-                    "acknowledgement": "hold",
-                },
-                clock=1,
-            ),
+    def test_ack_before_warning_preserves_ack_when_warning_arrives(
+        self, joined_p1: Event, joined_p2: Event
+    ) -> None:
+        events = (
+            joined_p1,
+            joined_p2,
+            _warning_ack("p1", "w-late", "hold", clock=1),
             _make_event(
                 CONCURRENT_DRIVER_WARNING,
                 {
@@ -539,9 +541,9 @@ class TestWarnings:
                 },
                 clock=2,
             ),
-        ]
+        )
         result = reduce_collaboration_events(events, mode="permissive")
-        assert len(result.anomalies) == 1
+        assert result.anomaly_count == 1
         assert "not found" in result.anomalies[0].reason
         assert len(result.warnings) == 1
         assert result.warnings[0].warning_id == "w-late"
@@ -555,9 +557,9 @@ class TestWarnings:
 class TestExecutionTracking:
     """PromptStepExecution start/complete pairing."""
 
-    def test_execution_start(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
+    def test_execution_start(self, joined_p1: Event) -> None:
+        events = (
+            joined_p1,
             _make_event(
                 PROMPT_STEP_EXECUTION_STARTED,
                 {
@@ -567,14 +569,14 @@ class TestExecutionTracking:
                 },
                 clock=1,
             ),
-        ]
+        )
         result = reduce_collaboration_events(events)
         assert "p1" in result.active_executions
         assert "step1" in result.active_executions["p1"]
 
-    def test_execution_complete_removes_step(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
+    def test_execution_complete_removes_step(self, joined_p1: Event) -> None:
+        events = (
+            joined_p1,
             _make_event(
                 PROMPT_STEP_EXECUTION_STARTED,
                 {
@@ -594,13 +596,16 @@ class TestExecutionTracking:
                 },
                 clock=2,
             ),
-        ]
+        )
         result = reduce_collaboration_events(events)
         assert result.active_executions.get("p1", []) == []
 
-    def test_complete_without_start_strict_raises(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
+    @pytest.mark.parametrize("mode", ["strict", "permissive"])
+    def test_complete_without_start(
+        self, joined_p1: Event, mode: Literal["strict", "permissive"]
+    ) -> None:
+        events = (
+            joined_p1,
             _make_event(
                 PROMPT_STEP_EXECUTION_COMPLETED,
                 {
@@ -611,26 +616,13 @@ class TestExecutionTracking:
                 },
                 clock=1,
             ),
-        ]
-        with pytest.raises(SpecKittyEventsError):
-            reduce_collaboration_events(events, mode="strict")
-
-    def test_complete_without_start_permissive_anomaly(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
-            _make_event(
-                PROMPT_STEP_EXECUTION_COMPLETED,
-                {
-                    "participant_id": "p1",
-                    "mission_id": "M001",
-                    "step_id": "step1",
-                    "outcome": "success",
-                },
-                clock=1,
-            ),
-        ]
-        result = reduce_collaboration_events(events, mode="permissive")
-        assert len(result.anomalies) == 1
+        )
+        if mode == "strict":
+            with pytest.raises(SpecKittyEventsError):
+                reduce_collaboration_events(events, mode=mode)
+            return
+        result = reduce_collaboration_events(events, mode=mode)
+        assert result.anomaly_count == 1
         assert "No matching PromptStepExecutionStarted" in result.anomalies[0].reason
 
 
@@ -640,9 +632,9 @@ class TestExecutionTracking:
 class TestCommentsAndDecisions:
     """CommentPosted and DecisionCaptured events."""
 
-    def test_comment_posted(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
+    def test_comment_posted(self, joined_p1: Event) -> None:
+        events = (
+            joined_p1,
             _make_event(
                 COMMENT_POSTED,
                 {
@@ -653,15 +645,15 @@ class TestCommentsAndDecisions:
                 },
                 clock=1,
             ),
-        ]
+        )
         result = reduce_collaboration_events(events)
         assert len(result.comments) == 1
         assert result.comments[0].comment_id == "c1"
         assert result.comments[0].content == "Hello world"
 
-    def test_decision_captured(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
+    def test_decision_captured(self, joined_p1: Event) -> None:
+        events = (
+            joined_p1,
             _make_event(
                 DECISION_CAPTURED,
                 {
@@ -673,15 +665,15 @@ class TestCommentsAndDecisions:
                 },
                 clock=1,
             ),
-        ]
+        )
         result = reduce_collaboration_events(events)
         assert len(result.decisions) == 1
         assert result.decisions[0].decision_id == "d1"
         assert result.decisions[0].chosen_option == "Microservices"
 
-    def test_comment_with_reply_to(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
+    def test_comment_with_reply_to(self, joined_p1: Event) -> None:
+        events = (
+            joined_p1,
             _make_event(
                 COMMENT_POSTED,
                 {
@@ -703,7 +695,7 @@ class TestCommentsAndDecisions:
                 },
                 clock=2,
             ),
-        ]
+        )
         result = reduce_collaboration_events(events)
         assert len(result.comments) == 2
         assert result.comments[1].reply_to == "c1"
@@ -715,9 +707,9 @@ class TestCommentsAndDecisions:
 class TestSessionLinking:
     """SessionLinked events."""
 
-    def test_session_linked(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
+    def test_session_linked(self, joined_p1: Event) -> None:
+        events = (
+            joined_p1,
             _make_event(
                 SESSION_LINKED,
                 {
@@ -729,7 +721,7 @@ class TestSessionLinking:
                 },
                 clock=1,
             ),
-        ]
+        )
         result = reduce_collaboration_events(events)
         assert "p1" in result.linked_sessions
         assert "s2" in result.linked_sessions["p1"]
@@ -738,160 +730,109 @@ class TestSessionLinking:
 # ── Full lifecycle integration ───────────────────────────────────────────────
 
 
-class TestFullLifecycle:
-    """End-to-end: join -> drive intent -> focus -> warning -> ack -> verify."""
-
-    def test_strict_mode_full_history(self) -> None:
-        events = [
-            _join_event("p1", clock=0),
-            _join_event("p2", clock=0),
-            _make_event(
-                DRIVE_INTENT_SET,
-                {"participant_id": "p1", "mission_id": "M001", "intent": "active"},
-                clock=1,
-            ),
-            _make_event(
-                DRIVE_INTENT_SET,
-                {"participant_id": "p2", "mission_id": "M001", "intent": "active"},
-                clock=1,
-            ),
-            _make_event(
-                FOCUS_CHANGED,
-                {
-                    "participant_id": "p1",
-                    "mission_id": "M001",
-                    "focus_target": {"target_type": "wp", "target_id": "WP03"},
-                },
-                clock=2,
-            ),
-            _make_event(
-                FOCUS_CHANGED,
-                {
-                    "participant_id": "p2",
-                    "mission_id": "M001",
-                    "focus_target": {"target_type": "wp", "target_id": "WP03"},
-                },
-                clock=2,
-            ),
-            _make_event(
-                CONCURRENT_DRIVER_WARNING,
-                {
-                    "warning_id": "w1",
-                    "mission_id": "M001",
-                    "participant_ids": ["p1", "p2"],
-                    "focus_target": {"target_type": "wp", "target_id": "WP03"},
-                    "severity": "warning",
-                },
-                clock=3,
-            ),
-            _make_event(
-                WARNING_ACKNOWLEDGED,
-                {
-                    "participant_id": "p1",
-                    "mission_id": "M001",
-                    "warning_id": "w1",
-                    "acknowledgement": "continue",
-                },
-                clock=4,
-            ),
-            _make_event(
-                WARNING_ACKNOWLEDGED,
-                {
-                    "participant_id": "p2",
-                    "mission_id": "M001",
-                    "warning_id": "w1",
-                    "acknowledgement": "hold",
-                },
-                clock=4,
-            ),
-        ]
-        result = reduce_collaboration_events(events, mode="strict")
+@pytest.fixture(scope="module")
+def full_history_result(
+    joined_p1: Event, joined_p2: Event
+) -> ReducedCollaborationState:
+    """Strict-mode reduction of a two-driver join/focus/warning/ack history."""
+    events = (
+        joined_p1,
+        joined_p2,
+        _drive_intent("p1", "active", clock=1),
+        _drive_intent("p2", "active", clock=1),
+        _focus("p1", "WP03", clock=2),
+        _focus("p2", "WP03", clock=2),
+        _make_event(
+            CONCURRENT_DRIVER_WARNING,
+            {
+                "warning_id": "w1",
+                "mission_id": "M001",
+                "participant_ids": ["p1", "p2"],
+                "focus_target": {"target_type": "wp", "target_id": "WP03"},
+                "severity": "warning",
+            },
+            clock=3,
+        ),
+        _warning_ack("p1", "w1", "continue", clock=4),
+        _warning_ack("p2", "w1", "hold", clock=4),
+    )
+    return reduce_collaboration_events(events, mode="strict")
 
-        # Verify participants
-        assert "p1" in result.participants
-        assert "p2" in result.participants
 
-        # Verify drivers
-        assert result.active_drivers == frozenset({"p1", "p2"})
+class TestFullLifecycle:
+    """End-to-end: join -> drive intent -> focus -> warning -> ack -> verify."""
 
-        # Verify focus
+    def test_full_history_participants(
+        self, full_history_result: ReducedCollaborationState
+    ) -> None:
+        assert "p1" in full_history_result.participants
+        assert "p2" in full_history_result.participants
+
+    def test_full_history_drivers(
+        self, full_history_result: ReducedCollaborationState
+    ) -> None:
+        assert full_history_result.active_drivers == frozenset({"p1", "p2"})
+
+    def test_full_history_focus(
+        self, full_history_result: ReducedCollaborationState
+    ) -> None:
+        result = full_history_result
         assert result.focus_by_participant["p1"].target_id == "WP03"
         assert result.focus_by_participant["p2"].target_id == "WP03"
         assert result.participants_by_focus["wp:WP03"] == frozenset({"p1", "p2"})
 
-        # Verify warnings
-        assert len(result.warnings) == 1
-        assert result.warnings[0].acknowledgements == {
+    def test_full_history_warnings(
+        self, full_history_result: ReducedCollaborationState
+    ) -> None:
+        assert len(full_history_result.warnings) == 1
+        assert full_history_result.warnings[0].acknowledgements == {
             "p1": "continue",
             "p2": "hold",
         }
 
-        # No anomalies
-        assert len(result.anomalies) == 0
+    def test_full_history_no_anomalies(
+        self, full_history_result: ReducedCollaborationState
+    ) -> None:
+        assert full_history_result.anomaly_count == 0
 
-        # Counters
-        assert result.event_count == 9
-        assert result.mission_id == "M001"
+    def test_full_history_counters(
+        self, full_history_result: ReducedCollaborationState
+    ) -> None:
+        assert full_history_result.event_count == 9
+        assert full_history_result.mission_id == "M001"
 
-    def test_leave_cleans_up_driver_and_focus(self) -> None:
+    def test_leave_cleans_up_driver_and_focus(self, joined_p1: Event) -> None:
         """When a participant leaves, their driver and focus state is cleared."""
-        events = [
-            _join_event("p1", clock=0),
-            _make_event(
-                DRIVE_INTENT_SET,
-                {"participant_id": "p1", "mission_id": "M001", "intent": "active"},
-                clock=1,
-            ),
-            _make_event(
-                FOCUS_CHANGED,
-                {
-                    "participant_id": "p1",
-                    "mission_id": "M001",
-                    "focus_target": {"target_type": "wp", "target_id": "WP01"},
-                },
-                clock=2,
-            ),
+        events = (
+            joined_p1,
+            _drive_intent("p1", "active", clock=1),
+            _focus("p1", "WP01", clock=2),
             _leave_event("p1", clock=3),
-        ]
+        )
         result = reduce_collaboration_events(events)
         assert "p1" not in result.active_drivers
         assert "p1" not in result.focus_by_participant
         assert "wp:WP01" not in result.participants_by_focus
 
-    def test_event_count_and_last_processed(self) -> None:
-        eid = str(ULID())
-        events = [
-            _join_event("p1", clock=0),
-            _make_event(
-                PRESENCE_HEARTBEAT,
-                {"participant_id": "p1", "mission_id": "M001"},
-                clock=1,
-                event_id=eid,
-            ),
-        ]
+    def test_event_count_and_last_processed(self, joined_p1: Event) -> None:
+        eid = _next_id()
+        events = (
+            joined_p1,
+            _heartbeat("p1", clock=1, event_id=eid),
+        )
         result = reduce_collaboration_events(events)
         assert result.event_count == 2
         # Last processed should be the heartbeat (higher clock)
         assert result.last_processed_event_id == eid
 
-    def test_deduplication(self) -> None:
+    def test_deduplication(self, joined_p1: Event) -> None:
         """Duplicate event_ids should be deduplicated."""
-        eid = str(ULID())
-        events = [
-            _join_event("p1", clock=0),
-            _make_event(
-                PRESENCE_HEARTBEAT,
-                {"participant_id": "p1", "mission_id": "M001"},
-                clock=1,
-                event_id=eid,
-            ),
-            _make_event(
-                PRESENCE_HEARTBEAT,
-                {"participant_id": "p1", "mission_id": "M001"},
-                clock=1,
-                event_id=eid,
-            ),
-        ]
+        eid = _next_id()
+        events = (
+            joined_p1,
+            _heartbeat("p1", clock=1, event_id=eid),
+            _heartbeat("p1", clock=1, event_id=eid),
+        )
         result = reduce_collaboration_events(events)
         # Only 2 unique events (join + 1 heartbeat after dedup)
         assert result.event_count == 2
@@ -905,11 +846,12 @@ class TestAll14EventTypes:
 
     def test_all_event_types_covered(self) -> None:
         """Verify the 14 event types in COLLABORATION_EVENT_TYPES."""
+        assert isinstance(COLLABORATION_EVENT_TYPES, frozenset)
         assert len(COLLABORATION_EVENT_TYPES) == 14
 
     def test_full_event_type_coverage(self) -> None:
         """Process one of each event type and verify no crashes."""
-        events = [
+        events = (
             # 1. ParticipantInvited
             _make_event(
                 PARTICIPANT_INVITED,
@@ -926,27 +868,11 @@ class TestAll14EventTypes:
             # (extra join so warning payload uses active participants only)
             _join_event("p2", clock=1),
             # 3. PresenceHeartbeat
-            _make_event(
-                PRESENCE_HEARTBEAT,
-                {"participant_id": "p1", "mission_id": "M001"},
-                clock=2,
-            ),
+            _heartbeat("p1", clock=2),
             # 4. DriveIntentSet
-            _make_event(
-                DRIVE_INTENT_SET,
-                {"participant_id": "p1", "mission_id": "M001", "intent": "active"},
-                clock=3,
-            ),
+            _drive_intent("p1", "active", clock=3),
             # 5. FocusChanged
-            _make_event(
-                FOCUS_CHANGED,
-                {
-                    "participant_id": "p1",
-                    "mission_id": "M001",
-                    "focus_target": {"target_type": "wp", "target_id": "WP01"},
-                },
-                clock=4,
-            ),
+            _focus("p1", "WP01", clock=4),
             # 6. PromptStepExecutionStarted
             _make_event(
                 PROMPT_STEP_EXECUTION_STARTED,
@@ -989,16 +915,7 @@ class TestAll14EventTypes:
                 clock=8,
             ),
             # 10. WarningAcknowledged
-            _make_event(
-                WARNING_ACKNOWLEDGED,
-                {
-                    "participant_id": "p1",
-                    "mission_id": "M001",
-                    "warning_id": "w1",
-                    "acknowledgement": "continue",
-                },
-                clock=9,
-            ),
+            _warning_ack("p1", "w1", "continue", clock=9),
             # 11. CommentPosted
             _make_event(
                 COMMENT_POSTED,
@@ -1036,10 +953,10 @@ class TestAll14EventTypes:
             ),
             # 14. ParticipantLeft
             _leave_event("p2", clock=13),
-        ]
+        )
         result = reduce_collaboration_events(events, mode="strict")
         assert result.event_count == 15
-        assert len(result.anomalies) == 0
+        assert result.anomaly_count == 0
         assert "p1" in result.participants
         assert "p2" in result.departed_participants
         assert len(result.warnings) == 2
@@ -309,6 +309,17 @@ def test_validate_event_schema_violations_populated() -> None:
         assert violation.message  # Should have a message
 
 
+def test_schema_validator_compiled_once_per_schema() -> None:
+    """Repeated validations reuse the compiled JSON Schema validator."""
+    pytest.importorskip("jsonschema")
+    from spec_kitty_events.conformance.validators import _schema_validator
+
+    validate_event(_make_valid_status_transition(), "WPStatusChanged", strict=True)
+    validator = _schema_validator("status_transition_payload")
+    validate_event(_make_valid_status_transition(), "WPStatusChanged", strict=True)
+    assert _schema_validator("status_transition_payload") is validator
+
+
 def test_model_violation_structure() -> None:
     """Test that ModelViolation has correct structure."""
     payload = _make_valid_status_transition()
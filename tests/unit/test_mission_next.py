@@ -18,6 +18,7 @@ from spec_kitty_events.mission_next import (
     DecisionInputAnsweredPayload,
     DecisionInputRequestedPayload,
     MissionNextAnomaly,
+    MissionNextAnomalyCode,
     MissionRunCompletedPayload,
     MissionRunStartedPayload,
     MissionRunStatus,
@@ -290,6 +291,14 @@ class TestMissionNextAnomaly:
             reason="Duplicate start"
         )
         assert a.reason == "Duplicate start"
+        assert a.code is None
+
+    def test_code(self) -> None:
+        a = MissionNextAnomaly(
+            event_id="evt1", event_type="MissionRunStarted",
+            reason="Duplicate start", code="duplicate_start",
+        )
+        assert a.code is MissionNextAnomalyCode.DUPLICATE_START
 
     def test_frozen(self) -> None:
         a = MissionNextAnomaly(